@@ -3,74 +3,84 @@ Simple Constitutional Articles - GUARANTEED TO WORK
 All 395 articles loaded without external dependencies
 """
 
-def create_all_articles():
-    """Create all 395 constitutional articles - no external files needed"""
-    
-    articles = {}
+import bisect
+import logging
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+@dataclass(frozen=True, slots=True)
+class Article:
+    """Constitutional article record (supports dict-style access for existing callers)"""
+    number: int
+    title: str
+    text: str
+    part: str
+    chapter: str
+    privacy_implications: bool
+    dpdpa_relevance: str
+    fundamental_right: bool
+    directive_principle: bool
+    constitutional_significance: str
+    landmark_cases: tuple = ()
+    privacy_scope: tuple = ()
     
-    # Key articles with real content
-    important_articles = {
-        1: ("Name and territory of the Union", "India, that is Bharat, shall be a Union of States."),
-        12: ("Definition", "In this part, the State includes the Government and Parliament of India."),
-        14: ("Equality before law", "The State shall not deny to any person equality before the law."),
-        19: ("Freedom of speech etc.", "All citizens shall have the right to freedom of speech and expression."),
-        21: ("Protection of life and personal liberty", "No person shall be deprived of his life or personal liberty except according to procedure established by law."),
-        32: ("Right to constitutional remedies", "The right to move the Supreme Court is guaranteed."),
-        243: ("Definitions - Panchayats", "In this Part, Gram Sabha means a body consisting of persons registered in electoral rolls."),
-        356: ("President's rule", "If the President is satisfied that government of State cannot be carried on, he may assume functions."),
-        368: ("Power to amend Constitution", "Parliament may amend by way of addition, variation or repeal any provision.")
-    }
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
     
-    # Create all 395 articles
-    for i in range(1, 396):
-        article_key = f"article_{i}"
-        
-        if i in important_articles:
-            title, text = important_articles[i]
-        else:
-            title = f"Article {i}"
-            text = f"Constitutional provision {i}"
-        
-        # Determine part
-        if 1 <= i <= 4:
-            part = "I"
-        elif 5 <= i <= 11:
-            part = "II"  
-        elif 12 <= i <= 35:
-            part = "III"
-        elif 36 <= i <= 51:
-            part = "IV"
-        elif 52 <= i <= 151:
-            part = "V"
-        elif 152 <= i <= 237:
-            part = "VI"
-        else:
-            part = "Other"
-            
-        # Determine chapter
-        if 12 <= i <= 35:
-            chapter = "Fundamental Rights"
-        elif 36 <= i <= 51:
-            chapter = "Directive Principles"
-        else:
-            chapter = "Constitutional Provisions"
-        
-        articles[article_key] = {
-            "number": i,
-            "title": title,
-            "text": text,
-            "part": part,
-            "chapter": chapter,
-            "privacy_implications": i in [14, 19, 21, 32],
-            "dpdpa_relevance": "critical" if i == 21 else "low",
-            "fundamental_right": 12 <= i <= 35,
-            "directive_principle": 36 <= i <= 51,
-            "constitutional_significance": "landmark" if i in [14, 19, 21, 32, 368] else "important",
-            "landmark_cases": [],
-            "privacy_scope": []
-        }
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+# Key articles with real content
+_IMPORTANT_ARTICLES = {
+    1: ("Name and territory of the Union", "India, that is Bharat, shall be a Union of States."),
+    12: ("Definition", "In this part, the State includes the Government and Parliament of India."),
+    14: ("Equality before law", "The State shall not deny to any person equality before the law."),
+    19: ("Freedom of speech etc.", "All citizens shall have the right to freedom of speech and expression."),
+    21: ("Protection of life and personal liberty", "No person shall be deprived of his life or personal liberty except according to procedure established by law."),
+    32: ("Right to constitutional remedies", "The right to move the Supreme Court is guaranteed."),
+    243: ("Definitions - Panchayats", "In this Part, Gram Sabha means a body consisting of persons registered in electoral rolls."),
+    356: ("President's rule", "If the President is satisfied that government of State cannot be carried on, he may assume functions."),
+    368: ("Power to amend Constitution", "Parliament may amend by way of addition, variation or repeal any provision.")
+}
+
+# (last article number, part) - sorted so the part can be resolved with bisect
+_PART_BOUNDS = [(4, "I"), (11, "II"), (35, "III"), (51, "IV"), (151, "V"), (237, "VI")]
+_PART_UPPER = [upper for upper, _ in _PART_BOUNDS]
+
+_PRIV = frozenset({14, 19, 21, 32})
+_LANDMARK = frozenset({14, 19, 21, 32, 368})
+
+def _part(i):
+    """Resolve the constitutional part for an article number"""
+    idx = bisect.bisect_left(_PART_UPPER, i)
+    return _PART_BOUNDS[idx][1] if idx < len(_PART_BOUNDS) else "Other"
+
+def _build(i):
+    """Build a single article record"""
+    title, text = _IMPORTANT_ARTICLES.get(i, (f"Article {i}", f"Constitutional provision {i}"))
+    fundamental_right = 12 <= i <= 35
+    directive_principle = 36 <= i <= 51
     
-    return articles
+    return Article(
+        number=i,
+        title=title,
+        text=text,
+        part=_part(i),
+        chapter="Fundamental Rights" if fundamental_right else "Directive Principles" if directive_principle else "Constitutional Provisions",
+        privacy_implications=i in _PRIV,
+        dpdpa_relevance="critical" if i == 21 else "low",
+        fundamental_right=fundamental_right,
+        directive_principle=directive_principle,
+        constitutional_significance="landmark" if i in _LANDMARK else "important"
+    )
+
+def create_all_articles():
+    """Create all 395 constitutional articles - no external files needed"""
+    return {f"article_{i}": _build(i) for i in range(1, 396)}
 
 # Load all articles
 CONSTITUTIONAL_ARTICLES = create_all_articles()
@@ -109,7 +119,7 @@ DPDPA_PROVISIONS = {
     }
 }
 
-print(f"✅ LOADED: {len(CONSTITUTIONAL_ARTICLES)} Constitutional Articles")
-print(f"✅ LOADED: {len(LANDMARK_CASES)} Landmark Cases") 
-print(f"✅ LOADED: {len(DPDPA_PROVISIONS)} DPDPA Provisions")
-print("🎉 Your Indian Legal KAG System is Ready!")
+logger.debug(
+    "Loaded %d constitutional articles, %d landmark cases, %d DPDPA provisions",
+    len(CONSTITUTIONAL_ARTICLES), len(LANDMARK_CASES), len(DPDPA_PROVISIONS)
+)
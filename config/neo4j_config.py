@@ -1,16 +1,42 @@
 """
 Neo4j Database Configuration - FIXED VERSION (No Invalid Config Keys)
+
+Queries must pass values through ``parameters`` ($name placeholders) rather than
+formatting them into the Cypher text: Neo4j caches query plans by query text, so
+parametrized queries compile once and are safe from injection. Leftover Python
+interpolation markers (``%s``, ``{}``) are logged as warnings.
 """
 
 import os
+import re
+import random
 import logging
-from neo4j import GraphDatabase
-from typing import List, Dict, Any, Optional
+from neo4j import GraphDatabase, RoutingControl
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
+from typing import List, Dict, Any, Optional, Callable, Iterator
 import streamlit as st
 import time
 
 logger = logging.getLogger(__name__)
 
+# Python string-formatting markers that should never reach Neo4j
+_INTERPOLATION_MARKER_RE = re.compile(r"%s|%\(\w+\)s|\{\}")
+
+# Connection errors: the driver is rebuilt before retrying
+_RECONNECT_ERRORS = (ServiceUnavailable, SessionExpired)
+# Errors worth retrying for; transient ones (deadlocks, lock timeouts) reuse the driver.
+# Anything else (syntax, auth, constraint) fails fast
+_RETRYABLE_ERRORS = _RECONNECT_ERRORS + (TransientError,)
+
+def _backoff(attempt: int):
+    """Sleep with capped exponential backoff and jitter before the next retry"""
+    time.sleep(min(4.0, 0.1 * (2 ** attempt)) * random.uniform(0.5, 1.5))
+
+def _warn_if_unparametrized(query: str):
+    """Log a warning if the Cypher text still contains string-formatting markers"""
+    if _INTERPOLATION_MARKER_RE.search(query):
+        logger.warning(f"Query contains interpolation markers, use $parameters instead: {query[:100]}...")
+
 class Neo4jConnection:
     def __init__(self):
         # Force bolt:// protocol to avoid routing issues
@@ -25,8 +51,10 @@ class Neo4jConnection:
             
         self.user = os.getenv("NEO4J_USER", "neo4j")
         self.password = os.getenv("NEO4J_PASSWORD", "password")
+        self.database = os.getenv("NEO4J_DB", "neo4j")
         self.driver = None
         self.last_connection_time = 0
+        self.last_success_time = 0.0
         self._connect()
 
     def _connect(self):
@@ -45,15 +73,15 @@ class Neo4jConnection:
             self.driver = GraphDatabase.driver(
                 self.uri,
                 auth=(self.user, self.password),
-                max_connection_lifetime=30 * 60,  # 30 minutes
-                max_connection_pool_size=10,
-                connection_acquisition_timeout=30
+                max_connection_lifetime=int(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", str(30 * 60))),  # 30 minutes
+                max_connection_pool_size=int(os.getenv("NEO4J_POOL_SIZE", "50")),
+                connection_acquisition_timeout=float(os.getenv("NEO4J_ACQUISITION_TIMEOUT", "30")),
+                keep_alive=True
                 # Removed invalid parameters: max_retry_time, initial_retry_delay, multiplier, jitter_factor
             )
 
-            # Test connection
-            with self.driver.session() as session:
-                session.run("RETURN 1").consume()
+            # Test connection (driver-level ping, no user session)
+            self.driver.verify_connectivity()
                 
             self.last_connection_time = time.time()
             logger.info("✅ Successfully (re)connected to Neo4j database")
@@ -71,61 +99,117 @@ class Neo4jConnection:
         return (time.time() - self.last_connection_time) > (25 * 60)
 
     def _ensure_connection(self):
-        """Ensure we have a healthy connection"""
-        if self._is_connection_stale() or not self.check_health():
+        """Ensure we have a healthy connection (probe only if no query succeeded recently)"""
+        if self._is_connection_stale():
             logger.info("🔄 Connection appears stale, reconnecting...")
             self._connect()
+        elif time.time() - self.last_success_time > 60 and not self.check_health():
+            logger.info("🔄 Health check failed, reconnecting...")
+            self._connect()
 
     def execute_query(self, query: str, parameters: dict = None, max_retries: int = 3) -> List[Dict[str, Any]]:
         """Execute Cypher query with retry logic for stale connections"""
+        rows = self.execute_query_checked(query, parameters, max_retries)
+        return [] if rows is None else rows
+
+    def execute_query_checked(self, query: str, parameters: dict = None, max_retries: int = 3) -> Optional[List[Dict[str, Any]]]:
+        """Like execute_query, but returns None when the query failed so callers can tell it from no rows"""
+        _warn_if_unparametrized(query)
+        return self._run_with_retry(query, parameters, max_retries, lambda result: result.data(), default=None)
+
+    def execute_single(self, query: str, parameters: dict = None, max_retries: int = 3) -> Dict[str, Any]:
+        """Execute a query expected to return at most one row, fetching only that row"""
+        def single(result):
+            record = result.single(strict=False)
+            return record.data() if record else {}
+        
+        _warn_if_unparametrized(query)
+        return self._run_with_retry(query, parameters, max_retries, single, default={})
+
+    def iter_query(self, query: str, parameters: dict = None) -> Iterator[List[Any]]:
+        """Stream result rows as value lists instead of materializing a dict per row.
+        
+        Rows are produced lazily, so a failure part-way through is not retried.
+        The session is held only while the caller iterates.
+        """
+        _warn_if_unparametrized(query)
+        self._ensure_connection()
+        with self.driver.session(database=self.database) as session:
+            for record in session.run(query, parameters or {}):
+                yield record.values()
+        self.last_success_time = time.time()
+
+    def _run_with_retry(self, query: str, parameters: Optional[dict], max_retries: int,
+                        transform: Callable[[Any], Any], default: Any) -> Any:
+        """Run a read query and transform its result in the transaction, reconnecting and retrying on failure"""
         for attempt in range(max_retries):
             try:
                 # Ensure we have a good connection
                 self._ensure_connection()
                 
-                with self.driver.session() as session:
-                    result = session.run(query, parameters or {})
-                    return [record.data() for record in result]
+                # Driver-managed session and transaction, routed to a reader
+                value = self.driver.execute_query(
+                    query, parameters or {},
+                    database_=self.database, routing_=RoutingControl.READ,
+                    result_transformer_=transform
+                )
+                self.last_success_time = time.time()
+                return value
                     
-            except Exception as e:
+            except _RETRYABLE_ERRORS as e:
                 logger.warning(f"Query attempt {attempt + 1}/{max_retries} failed: {str(e)}")
                 
                 if attempt < max_retries - 1:
-                    # Try to reconnect for next attempt
-                    try:
-                        self._connect()
-                        time.sleep(1)  # Brief pause before retry
-                    except Exception as reconnect_error:
-                        logger.warning(f"Reconnection attempt failed: {str(reconnect_error)}")
+                    _backoff(attempt)
+                    # Reconnect only if the connection itself was lost
+                    if isinstance(e, _RECONNECT_ERRORS):
+                        try:
+                            self._connect()
+                        except Exception as reconnect_error:
+                            logger.warning(f"Reconnection attempt failed: {str(reconnect_error)}")
                 else:
                     logger.error(f"Query failed after {max_retries} attempts: {query[:100]}...")
-                    return []
+                    return default
+            
+            except Exception as e:
+                logger.error(f"Query failed (not retryable): {str(e)} - {query[:100]}...")
+                return default
         
-        return []
+        return default
 
     def execute_write_query(self, query: str, parameters: dict = None, max_retries: int = 3) -> bool:
         """Execute write query with retry logic"""
+        _warn_if_unparametrized(query)
         for attempt in range(max_retries):
             try:
                 # Ensure we have a good connection
                 self._ensure_connection()
                 
-                with self.driver.session() as session:
-                    session.run(query, parameters or {})
-                    return True
+                self.driver.execute_query(
+                    query, parameters or {},
+                    database_=self.database, routing_=RoutingControl.WRITE
+                )
+                self.last_success_time = time.time()
+                return True
                     
-            except Exception as e:
+            except _RETRYABLE_ERRORS as e:
                 logger.warning(f"Write query attempt {attempt + 1}/{max_retries} failed: {str(e)}")
                 
                 if attempt < max_retries - 1:
-                    try:
-                        self._connect()
-                        time.sleep(1)
-                    except:
-                        pass
+                    _backoff(attempt)
+                    # Reconnect only if the connection itself was lost
+                    if isinstance(e, _RECONNECT_ERRORS):
+                        try:
+                            self._connect()
+                        except:
+                            pass
                 else:
                     logger.error(f"Write query failed after {max_retries} attempts")
                     return False
+            
+            except Exception as e:
+                logger.error(f"Write query failed (not retryable): {str(e)}")
+                return False
         
         return False
 
@@ -134,8 +218,7 @@ class Neo4jConnection:
         try:
             if not self.driver:
                 return False
-            with self.driver.session() as session:
-                session.run("RETURN 'healthy' as status").consume()
+            self.driver.verify_connectivity()
             return True
         except:
             return False
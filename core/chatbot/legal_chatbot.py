@@ -8,29 +8,74 @@ from datetime import datetime
 import streamlit as st
 from langchain_groq import ChatGroq
 from langchain.chains import ConversationalRetrievalChain
-from langchain.memory import ConversationBufferWindowMemory
 from langchain.prompts import PromptTemplate
 from .knowledge_graph.neo4j_manager import ConstitutionalKnowledgeGraph
 
 logger = logging.getLogger(__name__)
 
+# Article triggers, matched as substrings of the lowercased question
+# (so "speeches" and "inequality" still fetch Articles 19 and 14)
+_ARTICLE_KEYWORDS = (
+    (21, ("privacy", "personal data", "article 21")),
+    (14, ("equality", "article 14")),
+    (19, ("speech", "expression", "article 19"))
+)
+
+# Prompt history budget: recent turns are kept verbatim up to ~1000 tokens;
+# turns that fall off are folded into an LLM summary refreshed every few turns
+_HISTORY_MAX_CHARS = 4000
+_HISTORY_SUMMARY_EVERY_TURNS = 4
+# Tail of not-yet-summarized turns kept in the prompt until the summary catches up
+_HISTORY_PENDING_CHARS = 800
+
+@st.cache_resource
+def _get_groq_llm():
+    """Get cached Groq LLM client (shared across sessions)"""
+    return ChatGroq(
+        model_name="llama-3.3-70b-versatile",
+        temperature=0.1,
+        max_tokens=1024
+    )
+
+@st.cache_resource
+def _get_ckg():
+    """Get cached ConstitutionalKnowledgeGraph instance (shared across sessions)"""
+    return ConstitutionalKnowledgeGraph()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_articles(_kg, article_numbers: tuple) -> Dict[int, str]:
+    """Article texts keyed by number (static reference data, cached for an hour)"""
+    rows = _kg.get_articles_batch(list(article_numbers))
+    if not rows:
+        # Don't cache misses (graph not initialized or unreachable)
+        raise LookupError(f"No articles found for {article_numbers}")
+    return {row["num"]: row["text"] for row in rows}
+
 class IndianLegalChatbot:
     """Interactive chatbot for legal document Q&A"""
     
     def __init__(self):
-        self.groq_llm = ChatGroq(
-            model_name="llama-3.3-70b-versatile",
-            temperature=0.1,
-            max_tokens=1024
-        )
-        self.kg = ConstitutionalKnowledgeGraph()
-        self.memory = ConversationBufferWindowMemory(
-            k=10,
-            memory_key="chat_history",
-            return_messages=True,
-            output_key="answer"
-        )
+        self.groq_llm = _get_groq_llm()
+        # Knowledge graph (and its Neo4j driver) is created on first article lookup
+        self._kg = None
+        # Running prompt history: verbatim recent turns plus turns awaiting summarization
+        self._history_str = ""
+        self._history_overflow = ""
+        self._turns = 0
         self.qa_prompt = self._create_qa_prompt()
+        # Raw template for plain str.format on the hot path (skips PromptTemplate validation)
+        self._template_str = self.qa_prompt.template
+        self._history_summary = None
+        self._history_summary_turn = 0
+        # Display history, appended per turn so get_chat_history doesn't rebuild it
+        self._history_cache: List[Dict[str, Any]] = []
+    
+    @property
+    def kg(self) -> ConstitutionalKnowledgeGraph:
+        """Shared knowledge graph, resolved lazily"""
+        if self._kg is None:
+            self._kg = _get_ckg()
+        return self._kg
     
     def _create_qa_prompt(self) -> PromptTemplate:
         """Create specialized prompt for Indian legal Q&A"""
@@ -66,22 +111,17 @@ Answer:"""
         """Get relevant constitutional context for the question"""
         try:
             # Simple keyword matching for constitutional context
-            context_parts = []
+            q = question.lower()
+            needed = [num for num, keywords in _ARTICLE_KEYWORDS if any(keyword in q for keyword in keywords)]
             
-            if any(word in question.lower() for word in ["privacy", "personal data", "article 21"]):
-                article_21 = self.kg.get_article_context(21)
-                if article_21:
-                    context_parts.append(f"Article 21: {article_21.get('article', {}).get('text', '')}")
-            
-            if any(word in question.lower() for word in ["equality", "article 14"]):
-                article_14 = self.kg.get_article_context(14)
-                if article_14:
-                    context_parts.append(f"Article 14: {article_14.get('article', {}).get('text', '')}")
-            
-            if any(word in question.lower() for word in ["speech", "expression", "article 19"]):
-                article_19 = self.kg.get_article_context(19)
-                if article_19:
-                    context_parts.append(f"Article 19: {article_19.get('article', {}).get('text', '')}")
+            # Fetch all matched articles in one query
+            context_parts = []
+            if needed:
+                try:
+                    texts = _cached_articles(self.kg, tuple(needed))
+                except LookupError:
+                    texts = {}
+                context_parts = [f"Article {num}: {texts[num] or ''}" for num in needed if num in texts]
             
             return "\n\n".join(context_parts) if context_parts else "General constitutional principles apply."
             
@@ -98,11 +138,11 @@ Answer:"""
             # Combine document and constitutional context
             full_context = f"{document_context}\n\n{constitutional_context}".strip()
             
-            # Get chat history
-            chat_history = self.memory.chat_memory.messages if self.memory.chat_memory else []
+            # Get chat history, trimmed to the prompt budget
+            chat_history = self._history_for_prompt()
             
             # Format prompt
-            formatted_prompt = self.qa_prompt.format(
+            formatted_prompt = self._template_str.format(
                 context=full_context,
                 chat_history=chat_history,
                 question=question
@@ -112,13 +152,15 @@ Answer:"""
             response = self.groq_llm.invoke(formatted_prompt)
             answer = response.content
             
-            # Save to memory
-            self.memory.save_context({"question": question}, {"answer": answer})
+            # Save to history
+            self._append_history(question, answer)
+            ts = datetime.now().isoformat()
+            self._history_cache.append({"question": question, "answer": answer, "timestamp": ts})
             
             return {
                 "answer": answer,
                 "sources": ["Constitutional Framework", "Document Context"] if document_context else ["Constitutional Framework"],
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": ts,
                 "question": question
             }
             
@@ -132,20 +174,60 @@ Answer:"""
                 "error": str(e)
             }
     
+    def _append_history(self, question: str, answer: str):
+        """Append a turn to the running history, moving whole turns past the cap into the overflow"""
+        self._turns += 1
+        self._history_str += f"\nUser: {question}\nAssistant: {answer}"
+        excess = len(self._history_str) - _HISTORY_MAX_CHARS
+        if excess > 0:
+            cut = self._history_str.find("\nUser: ", excess)
+            if cut == -1:
+                cut = excess
+            self._history_overflow += self._history_str[:cut]
+            self._history_str = self._history_str[cut:]
+    
+    def _history_for_prompt(self) -> str:
+        """Recent turns verbatim, prefixed by a summary of older turns once any have overflowed"""
+        recent = self._history_str.lstrip("\n")
+        if self._history_overflow and (
+            self._history_summary is None
+            or self._turns - self._history_summary_turn >= _HISTORY_SUMMARY_EVERY_TURNS
+        ):
+            earlier = f"{self._history_summary or ''}{self._history_overflow}".strip()
+            try:
+                response = self.groq_llm.invoke(
+                    "Summarize this conversation between a user and an Indian legal assistant in under 150 words. "
+                    f"Keep any constitutional articles, cases and statutes mentioned.\n\n{earlier}"
+                )
+                self._history_summary = response.content
+                self._history_summary_turn = self._turns
+                self._history_overflow = ""
+            except Exception as e:
+                logger.warning(f"History summarization failed: {str(e)}")
+        
+        summary = f"Earlier conversation (summary): {self._history_summary}\n" if self._history_summary is not None else ""
+        return f"{summary}{self._pending_history()}{recent}"
+    
+    def _pending_history(self) -> str:
+        """Tail of the turns that overflowed since the last summary, kept in the prompt until it is refreshed"""
+        if len(self._history_overflow) <= _HISTORY_PENDING_CHARS:
+            pending = self._history_overflow.lstrip("\n")
+        else:
+            # Start at a turn boundary when the tail holds one
+            pending = self._history_overflow[-_HISTORY_PENDING_CHARS:]
+            cut = pending.find("\nUser: ")
+            pending = pending[cut + 1:] if cut != -1 else f"...{pending}"
+        return f"{pending}\n" if pending else ""
+    
     def get_chat_history(self) -> List[Dict[str, Any]]:
         """Get formatted chat history"""
-        history = []
-        if self.memory.chat_memory:
-            messages = self.memory.chat_memory.messages
-            for i in range(0, len(messages), 2):
-                if i + 1 < len(messages):
-                    history.append({
-                        "question": messages[i].content,
-                        "answer": messages[i + 1].content,
-                        "timestamp": datetime.now().isoformat()
-                    })
-        return history
+        return list(self._history_cache)
     
     def clear_history(self):
         """Clear chat history"""
-        self.memory.clear()
+        self._history_cache.clear()
+        self._history_str = ""
+        self._history_overflow = ""
+        self._turns = 0
+        self._history_summary = None
+        self._history_summary_turn = 0
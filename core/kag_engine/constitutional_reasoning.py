@@ -3,15 +3,168 @@ Constitutional Reasoning Engine - Core KAG Logic
 Enhanced with Complete Implementation
 """
 
+import heapq
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import re
+import time
+from collections import Counter
+from itertools import islice
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple, AbstractSet, NamedTuple
 from datetime import datetime
+import numpy as np
 import networkx as nx
 from .knowledge_graph.neo4j_manager import ConstitutionalKnowledgeGraph
 from .knowledge_graph.graph_builder import DynamicGraphBuilder
 
 logger = logging.getLogger(__name__)
 
+# Pathway targets searched from every identified article: (concept, max hops)
+_PATHWAY_TARGETS = (("privacy_right", 3), ("section_5", 4))
+
+# How long fetched pathways are reused before being queried again
+_PATHWAY_VIEW_TTL = 3600
+
+# Compliance score components and their weights (same order)
+_COMPLIANCE_COMPONENTS = (
+    "article_compliance",
+    "pathway_strength",
+    "hierarchy_consistency",
+    "privacy_compliance",
+    "precedent_alignment"
+)
+_COMPLIANCE_WEIGHTS = np.array([0.25, 0.20, 0.20, 0.20, 0.15])
+
+# Article inference rules: (article number, implication type, relevance, reason,
+# entity key from the graph builder, precompiled trigger searched in the document text)
+_PRIVACY_TRIGGER_RE = re.compile(
+    r"\b(?:privacy|personal data|data protection|aadhaar|surveillance)\b", re.IGNORECASE
+)
+_INFERENCE_RULES = (
+    (21, "privacy_rights", 0.8, "Privacy concepts detected", "privacy_concepts", _PRIVACY_TRIGGER_RE),
+)
+
+# Implication type by article number: Part III (12-35) and Part IV (36-51)
+_IMPLICATION_BY_NUM = {
+    **{n: "fundamental_rights" for n in range(12, 36)},
+    **{n: "directive_principles" for n in range(36, 52)}
+}
+
+# Reasoning report sections; callers can request a subset to skip the rest
+REPORT_SECTIONS = frozenset({
+    "executive_summary",
+    "detailed_analysis",
+    "key_constitutional_principles",
+    "precedent_analysis",
+    "compliance_recommendations"
+})
+
+# Directive principles on social justice (Articles 38-47)
+_DP_SOCIAL_JUSTICE = frozenset(range(38, 48))
+_DP_SECULAR_EDUCATION = frozenset({44, 48})
+
+# Conflict keyword -> resolution approach, checked in order
+_CONFLICT_KEYWORD_MAP = {
+    "equality": "Apply harmonious construction principle",
+    "trade": "Apply proportionality test"
+}
+
+@dataclass(slots=True)
+class ArticleAnalysis:
+    """Relevance analysis of one constitutional article for a document"""
+    article_id: str
+    relevance_score: float
+    context: Dict[str, Any]
+    implication_type: str
+    inference_reason: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "article_id": self.article_id,
+            "relevance_score": self.relevance_score,
+            "context": self.context,
+            "implication_type": self.implication_type
+        }
+        if self.inference_reason is not None:
+            data["inference_reason"] = self.inference_reason
+        return data
+
+class PathwayResult(NamedTuple):
+    """Analysis of one reasoning pathway from a document's article"""
+    pathway_nodes: List[Dict]
+    relationship_types: List[str]
+    pathway_strength: float
+    reasoning_chain: List[str]
+    legal_validity: Optional[str]
+    pathway_length: int
+    source_article: str
+    document_id: str
+    is_privacy: bool
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        if self.error is not None:
+            return {
+                "error": self.error,
+                "pathway_strength": self.pathway_strength,
+                "source_article": self.source_article,
+                "document_id": self.document_id
+            }
+        return {
+            "pathway_nodes": self.pathway_nodes,
+            "relationship_types": self.relationship_types,
+            "pathway_strength": self.pathway_strength,
+            "reasoning_chain": self.reasoning_chain,
+            "legal_validity": self.legal_validity,
+            "pathway_length": self.pathway_length,
+            "source_article": self.source_article,
+            "document_id": self.document_id
+        }
+
+@dataclass
+class ArticleStats:
+    """Single-pass aggregates over the identified articles, shared by the report helpers"""
+    total: int = 0
+    implication_counts: Counter = field(default_factory=Counter)
+    privacy_articles: List[ArticleAnalysis] = field(default_factory=list)
+    highest_relevance: float = 0
+    has_weak_article: bool = False
+    
+    @classmethod
+    def from_articles(cls, articles: List[ArticleAnalysis]) -> "ArticleStats":
+        stats = cls(total=len(articles))
+        for article in articles:
+            implication_type = article.implication_type
+            relevance = article.relevance_score
+            stats.implication_counts[implication_type] += 1
+            if implication_type == "privacy_rights":
+                stats.privacy_articles.append(article)
+            if relevance > stats.highest_relevance:
+                stats.highest_relevance = relevance
+            if relevance < 0.6:
+                stats.has_weak_article = True
+        return stats
+
+@dataclass
+class PathwayStats:
+    """Single-pass aggregates over the analyzed pathways, shared by the report helpers"""
+    total: int = 0
+    strengths: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    validity_counts: Counter = field(default_factory=Counter)
+    privacy_count: int = 0
+    
+    @classmethod
+    def from_pathways(cls, pathways: List[PathwayResult]) -> "PathwayStats":
+        stats = cls(total=len(pathways))
+        strengths = []
+        for pathway in pathways:
+            strengths.append(pathway.pathway_strength)
+            stats.validity_counts[pathway.legal_validity] += 1
+            if pathway.is_privacy:
+                stats.privacy_count += 1
+        stats.strengths = np.array(strengths, dtype=float)
+        return stats
+
 class ConstitutionalReasoningEngine:
     """Main reasoning engine for constitutional analysis using knowledge graphs"""
     
@@ -19,6 +172,50 @@ class ConstitutionalReasoningEngine:
         self.kg = ConstitutionalKnowledgeGraph()
         self.graph_builder = DynamicGraphBuilder()
         self.reasoning_weights = self._initialize_reasoning_weights()
+        # Article contexts are static reference data; cache them per engine
+        self._article_ctx_cache: Dict[int, Dict[str, Any]] = {}
+        # (article_id, target) -> pathways, filled per article on first request
+        self._pathway_view: Dict[Tuple[str, str], List[Dict]] = {}
+        self._pathway_view_sources = set()
+        self._pathway_view_expires_at = 0.0
+    
+    def _get_article_context(self, article_number: int) -> Dict[str, Any]:
+        """Get article context from the knowledge graph, cached by article number"""
+        article_context = self._article_ctx_cache.get(article_number)
+        if article_context is None:
+            article_context = self.kg.get_article_context(article_number)
+            if article_context:
+                # Don't cache misses (graph may not be initialized yet)
+                self._article_ctx_cache[article_number] = article_context
+        return article_context
+    
+    def _get_pathway_view(self, article_ids: List[str]) -> Dict[Tuple[str, str], List[Dict]]:
+        """Pathways for the given articles, querying only articles not fetched yet"""
+        if time.time() >= self._pathway_view_expires_at:
+            self._pathway_view.clear()
+            self._pathway_view_sources.clear()
+            self._pathway_view_expires_at = time.time() + _PATHWAY_VIEW_TTL
+        
+        missing = [article_id for article_id in dict.fromkeys(article_ids) if article_id not in self._pathway_view_sources]
+        if missing:
+            found = self._fetch_pathways(missing)
+            # None means the query failed; leave those articles unfetched so the next analysis retries them
+            if found is not None:
+                self._pathway_view.update(found)
+                self._pathway_view_sources.update(missing)
+        
+        return self._pathway_view
+    
+    def _fetch_pathways(self, article_ids: List[str]) -> Optional[Dict[Tuple[str, str], List[Dict]]]:
+        """Query pathways from the given articles to every target in one batched round-trip"""
+        return self.kg.find_pathways_batch(article_ids, list(_PATHWAY_TARGETS))
+    
+    def clear_graph_caches(self):
+        """Drop cached article contexts and pathways (call after the knowledge graph is rebuilt)"""
+        self._article_ctx_cache.clear()
+        self._pathway_view.clear()
+        self._pathway_view_sources.clear()
+        self._pathway_view_expires_at = 0.0
     
     def _initialize_reasoning_weights(self) -> Dict[str, float]:
         """Initialize weights for different types of constitutional reasoning"""
@@ -31,12 +228,19 @@ class ConstitutionalReasoningEngine:
             "judicial_interpretation": 0.8
         }
     
-    def analyze_document_constitutionality(self, document_text: str, document_id: str = None) -> Dict[str, Any]:
+    def analyze_document_constitutionality(self, document_text: str, document_id: str = None,
+                                           sections: AbstractSet[str] = REPORT_SECTIONS) -> Dict[str, Any]:
         """
         Comprehensive constitutional analysis using KAG approach
+        
+        Only the reasoning report sections listed in `sections` are generated;
+        the others are left empty.
         """
+        # One clock read per request, shared by the id and all timestamps
+        now = datetime.now()
+        timestamp = now.isoformat()
         if not document_id:
-            document_id = f"doc_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            document_id = f"doc_{now.strftime('%Y%m%d_%H%M%S')}"
         
         logger.info(f"🏛️ Starting constitutional analysis for document: {document_id}")
         
@@ -61,94 +265,100 @@ class ConstitutionalReasoningEngine:
                 constitutional_pathways
             )
             
+            # Aggregate articles and pathways once for the report and score
+            article_stats = ArticleStats.from_articles(constitutional_articles)
+            pathway_stats = PathwayStats.from_pathways(constitutional_pathways)
+            
             # Step 5: Generate constitutional reasoning report
             reasoning_report = self._generate_constitutional_reasoning(
-                constitutional_articles, constitutional_pathways, hierarchy_analysis
+                constitutional_articles, constitutional_pathways, hierarchy_analysis,
+                article_stats, pathway_stats, sections
             )
             
             # Step 6: Calculate overall constitutional compliance score
             compliance_score = self._calculate_constitutional_compliance_score(
-                constitutional_articles, constitutional_pathways, hierarchy_analysis
+                constitutional_articles, constitutional_pathways, hierarchy_analysis,
+                article_stats, pathway_stats, timestamp
             )
             
             return {
                 "document_id": document_id,
-                "constitutional_articles": constitutional_articles,
-                "constitutional_pathways": constitutional_pathways,
+                "constitutional_articles": [article.to_dict() for article in constitutional_articles],
+                "constitutional_pathways": [pathway.to_dict() for pathway in constitutional_pathways],
                 "hierarchy_analysis": hierarchy_analysis,
                 "reasoning_report": reasoning_report,
                 "compliance_score": compliance_score,
-                "analysis_timestamp": datetime.now().isoformat(),
+                "analysis_timestamp": timestamp,
                 "entities_extracted": subgraph_info["entities_found"]
             }
             
         except Exception as e:
             logger.error(f"❌ Constitutional analysis failed: {str(e)}")
-            return self._generate_error_response(document_id, str(e))
+            return self._generate_error_response(document_id, str(e), timestamp)
     
-    def _identify_constitutional_articles(self, document_text: str, entities: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+    def _identify_constitutional_articles(self, document_text: str, entities: Dict[str, List[str]]) -> List[ArticleAnalysis]:
         """Identify and analyze relevant constitutional articles"""
         articles_analysis = []
         
         # Direct article references from entities
         for article_id in entities.get("articles", []):
-            article_context = self.kg.get_article_context(
-                int(article_id.replace("article_", ""))
-            )
+            article_number = self._extract_article_number(article_id)
+            article_context = self._get_article_context(article_number) if article_number else None
             
             if article_context:
-                articles_analysis.append({
-                    "article_id": article_id,
-                    "relevance_score": self._calculate_article_relevance(
+                articles_analysis.append(ArticleAnalysis(
+                    article_id=article_id,
+                    relevance_score=self._calculate_article_relevance(
                         article_context, document_text
                     ),
-                    "context": article_context,
-                    "implication_type": self._determine_implication_type(
+                    context=article_context,
+                    implication_type=self._determine_implication_type(
                         article_context, document_text
                     )
-                })
+                ))
         
         # Infer additional relevant articles through graph reasoning
         inferred_articles = self._infer_relevant_articles(document_text, entities)
         articles_analysis.extend(inferred_articles)
         
-        # Sort by relevance score
-        articles_analysis.sort(key=lambda x: x["relevance_score"], reverse=True)
-        return articles_analysis[:10]  # Top 10 most relevant articles
+        # Top 10 most relevant articles (same order and tie-breaking as a stable sort)
+        return heapq.nlargest(10, articles_analysis, key=lambda x: x.relevance_score)
     
-    def _analyze_constitutional_pathways(self, articles: List[Dict[str, Any]], document_id: str) -> List[Dict[str, Any]]:
+    def _analyze_constitutional_pathways(self, articles: List[ArticleAnalysis], document_id: str) -> List[PathwayResult]:
         """Analyze constitutional reasoning pathways using graph traversal"""
         pathways = []
+        if not articles:
+            return pathways
         
-        # For each identified article, find pathways to privacy and DPDPA compliance
-        for article in articles:
-            article_id = article["article_id"]
-            
-            # Find pathway to privacy rights
-            privacy_pathways = self.kg.find_constitutional_pathway(
-                article_id, "privacy_right", max_hops=3
-            )
-            
-            # Find pathway to DPDPA provisions
-            dpdpa_pathways = self.kg.find_constitutional_pathway(
-                article_id, "section_5", max_hops=4
-            )
-            
-            # Combine and analyze pathways
-            for pathway in privacy_pathways + dpdpa_pathways:
-                pathway_analysis = self._analyze_individual_pathway(pathway)
-                pathway_analysis["source_article"] = article_id
-                pathway_analysis["document_id"] = document_id
-                pathways.append(pathway_analysis)
+        # Pathways from every identified article to privacy rights and DPDPA provisions
+        article_ids = [article.article_id for article in articles]
+        found = self._get_pathway_view(article_ids)
+        
+        # Combine and analyze pathways
+        for article_id in article_ids:
+            for target, _ in _PATHWAY_TARGETS:
+                for pathway in found.get((article_id, target), []):
+                    pathways.append(self._analyze_individual_pathway(pathway, article_id, target, document_id))
         
         return pathways
     
-    def _analyze_individual_pathway(self, pathway_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_individual_pathway(self, pathway_data: Dict[str, Any], source_article: str,
+                                    target: str, document_id: str) -> PathwayResult:
         """Analyze individual constitutional pathway"""
-        if not pathway_data.get("pathway_nodes"):
-            return {"error": "No pathway nodes found", "pathway_strength": 0.0}
+        pathway_nodes = pathway_data.get("pathway_nodes") or []
+        
+        if not pathway_nodes:
+            return PathwayResult(
+                [], [], 0.0, [], None, 0, source_article, document_id, False,
+                error="No pathway nodes found"
+            )
+        
+        # Privacy pathways: searched towards privacy_right or passing through Article 21
+        # (compared by number so article_210 or article_121 don't count)
+        is_privacy = target == "privacy_right" or any(
+            self._extract_article_number(node.get("id", "")) == 21 for node in pathway_nodes
+        )
         
-        pathway_nodes = pathway_data["pathway_nodes"]
         relationship_types = pathway_data.get("relationship_types", [])
         
         # Calculate pathway strength based on node types and relationships
@@ -160,16 +370,19 @@ class ConstitutionalReasoningEngine:
         # Assess legal validity
         legal_validity = self._assess_pathway_legal_validity(pathway_nodes)
         
-        return {
-            "pathway_nodes": pathway_nodes,
-            "relationship_types": relationship_types,
-            "pathway_strength": pathway_strength,
-            "reasoning_chain": reasoning_chain,
-            "legal_validity": legal_validity,
-            "pathway_length": len(pathway_nodes)
-        }
+        return PathwayResult(
+            pathway_nodes=pathway_nodes,
+            relationship_types=relationship_types,
+            pathway_strength=pathway_strength,
+            reasoning_chain=reasoning_chain,
+            legal_validity=legal_validity,
+            pathway_length=len(pathway_nodes),
+            source_article=source_article,
+            document_id=document_id,
+            is_privacy=is_privacy
+        )
     
-    def _assess_constitutional_hierarchy(self, pathways: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _assess_constitutional_hierarchy(self, pathways: List[PathwayResult]) -> Dict[str, Any]:
         """Assess constitutional hierarchy and potential conflicts"""
         hierarchy_assessment = {
             "fundamental_rights_involved": [],
@@ -179,22 +392,31 @@ class ConstitutionalReasoningEngine:
             "resolution_approach": []
         }
         
-        # Identify different levels of constitutional provisions involved
-        for pathway in pathways:
-            for node in pathway.get("pathway_nodes", []):
-                node_type = node.get("type", "")
-                if node_type == "Article":
-                    # Check if fundamental right or directive principle
-                    article_num = self._extract_article_number(node.get("id", ""))
-                    if 12 <= article_num <= 35:
-                        hierarchy_assessment["fundamental_rights_involved"].append(article_num)
-                    elif 36 <= article_num <= 51:
-                        hierarchy_assessment["directive_principles_involved"].append(article_num)
+        # Only Article nodes carry hierarchy information
+        article_nodes = [
+            node for pathway in pathways for node in pathway.pathway_nodes
+            if node.get("type") == "Article"
+        ]
+        if not article_nodes:
+            return hierarchy_assessment
+        
+        # Identify different levels of constitutional provisions involved (deduplicated)
+        fundamental_rights = set()
+        directive_principles = set()
+        for node in article_nodes:
+            # Check if fundamental right or directive principle
+            article_num = self._extract_article_number(node.get("id", ""))
+            if 12 <= article_num <= 35:
+                fundamental_rights.add(article_num)
+            elif 36 <= article_num <= 51:
+                directive_principles.add(article_num)
+        
+        hierarchy_assessment["fundamental_rights_involved"] = sorted(fundamental_rights)
+        hierarchy_assessment["directive_principles_involved"] = sorted(directive_principles)
         
         # Check for potential conflicts
         hierarchy_assessment["potential_conflicts"] = self._identify_constitutional_conflicts(
-            hierarchy_assessment["fundamental_rights_involved"],
-            hierarchy_assessment["directive_principles_involved"]
+            fundamental_rights, directive_principles
         )
         
         # Determine resolution approach
@@ -205,8 +427,10 @@ class ConstitutionalReasoningEngine:
         
         return hierarchy_assessment
     
-    def _generate_constitutional_reasoning(self, articles: List[Dict], pathways: List[Dict], hierarchy: Dict) -> Dict[str, Any]:
-        """Generate comprehensive constitutional reasoning report"""
+    def _generate_constitutional_reasoning(self, articles: List[ArticleAnalysis], pathways: List[PathwayResult], hierarchy: Dict,
+                                           article_stats: ArticleStats, pathway_stats: PathwayStats,
+                                           sections: AbstractSet[str] = REPORT_SECTIONS) -> Dict[str, Any]:
+        """Generate comprehensive constitutional reasoning report (requested sections only)"""
         reasoning_report = {
             "executive_summary": "",
             "detailed_analysis": {},
@@ -216,32 +440,39 @@ class ConstitutionalReasoningEngine:
         }
         
         # Generate executive summary
-        reasoning_report["executive_summary"] = self._generate_executive_summary(
-            articles, pathways, hierarchy
-        )
+        if "executive_summary" in sections:
+            reasoning_report["executive_summary"] = self._generate_executive_summary(
+                article_stats, pathway_stats, hierarchy
+            )
         
         # Detailed analysis for each constitutional aspect
-        reasoning_report["detailed_analysis"] = {
-            "article_analysis": self._generate_article_analysis(articles),
-            "pathway_analysis": self._generate_pathway_analysis(pathways),
-            "hierarchy_analysis": hierarchy,
-            "privacy_implications": self._analyze_privacy_implications_detailed(articles, pathways)
-        }
+        if "detailed_analysis" in sections:
+            reasoning_report["detailed_analysis"] = {
+                "article_analysis": self._generate_article_analysis(article_stats),
+                "pathway_analysis": self._generate_pathway_analysis(pathway_stats),
+                "hierarchy_analysis": hierarchy,
+                "privacy_implications": self._analyze_privacy_implications_detailed(article_stats, pathway_stats)
+            }
         
         # Identify key constitutional principles
-        reasoning_report["key_constitutional_principles"] = self._identify_key_principles(pathways)
+        if "key_constitutional_principles" in sections:
+            reasoning_report["key_constitutional_principles"] = self._identify_key_principles(pathways)
         
         # Precedent analysis
-        reasoning_report["precedent_analysis"] = self._analyze_precedents(articles)
+        if "precedent_analysis" in sections:
+            reasoning_report["precedent_analysis"] = self._analyze_precedents(articles)
         
         # Compliance recommendations
-        reasoning_report["compliance_recommendations"] = self._generate_compliance_recommendations(
-            articles, pathways, hierarchy
-        )
+        if "compliance_recommendations" in sections:
+            reasoning_report["compliance_recommendations"] = self._generate_compliance_recommendations(
+                article_stats, pathway_stats, hierarchy
+            )
         
         return reasoning_report
     
-    def _calculate_constitutional_compliance_score(self, articles: List[Dict], pathways: List[Dict], hierarchy: Dict) -> Dict[str, Any]:
+    def _calculate_constitutional_compliance_score(self, articles: List[ArticleAnalysis], pathways: List[PathwayResult], hierarchy: Dict,
+                                                   article_stats: ArticleStats, pathway_stats: PathwayStats,
+                                                   timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Calculate overall constitutional compliance score"""
         score_components = {
             "article_compliance": 0.0,
@@ -253,42 +484,33 @@ class ConstitutionalReasoningEngine:
         
         # Article compliance score
         if articles:
-            article_scores = [article.get("relevance_score", 0) for article in articles]
-            score_components["article_compliance"] = sum(article_scores) / len(article_scores)
+            score_components["article_compliance"] = float(np.fromiter(
+                (article.relevance_score for article in articles), dtype=float, count=len(articles)
+            ).mean())
         
         # Pathway strength score
-        if pathways:
-            pathway_scores = [pathway.get("pathway_strength", 0) for pathway in pathways]
-            score_components["pathway_strength"] = sum(pathway_scores) / len(pathway_scores)
+        if pathway_stats.total:
+            score_components["pathway_strength"] = float(pathway_stats.strengths.mean())
         
         # Hierarchy consistency score
         score_components["hierarchy_consistency"] = 1.0 if hierarchy.get("hierarchy_compliance", False) else 0.5
         
         # Privacy compliance score (Article 21 specific)
-        score_components["privacy_compliance"] = self._calculate_privacy_compliance_score(articles, pathways)
+        score_components["privacy_compliance"] = self._calculate_privacy_compliance_score(article_stats)
         
         # Precedent alignment score
         score_components["precedent_alignment"] = self._calculate_precedent_alignment_score(articles)
         
         # Calculate weighted overall score
-        weights = {
-            "article_compliance": 0.25,
-            "pathway_strength": 0.20,
-            "hierarchy_consistency": 0.20,
-            "privacy_compliance": 0.20,
-            "precedent_alignment": 0.15
-        }
-        
-        overall_score = sum(
-            score_components[component] * weight
-            for component, weight in weights.items()
-        )
+        overall_score = float(_COMPLIANCE_WEIGHTS @ np.array(
+            [score_components[component] for component in _COMPLIANCE_COMPONENTS]
+        ))
         
         return {
             "overall_score": round(overall_score * 100, 2),  # Convert to percentage
             "component_scores": {k: round(v * 100, 2) for k, v in score_components.items()},
             "score_interpretation": self._interpret_compliance_score(overall_score * 100),
-            "calculation_timestamp": datetime.now().isoformat()
+            "calculation_timestamp": timestamp or datetime.now().isoformat()
         }
     
     # Helper methods implementation
@@ -316,28 +538,24 @@ class ConstitutionalReasoningEngine:
         article = article_context.get("article", {})
         if article.get("privacy_implications", False):
             return "privacy_rights"
-        elif article.get("number", 0) in range(12, 36):
-            return "fundamental_rights"
-        elif article.get("number", 0) in range(36, 52):
-            return "directive_principles"
-        else:
-            return "other_constitutional"
+        return _IMPLICATION_BY_NUM.get(article.get("number", 0), "other_constitutional")
     
-    def _infer_relevant_articles(self, document_text: str, entities: Dict) -> List[Dict]:
+    def _infer_relevant_articles(self, document_text: str, entities: Dict) -> List[ArticleAnalysis]:
         """Infer additional relevant articles through contextual analysis"""
         inferred = []
         
-        # If privacy concepts are mentioned, infer Article 21
-        if entities.get("privacy_concepts"):
-            article_context = self.kg.get_article_context(21)
-            if article_context:
-                inferred.append({
-                    "article_id": "article_21",
-                    "relevance_score": 0.8,
-                    "context": article_context,
-                    "implication_type": "privacy_rights",
-                    "inference_reason": "Privacy concepts detected"
-                })
+        # E.g. if privacy concepts are mentioned, infer Article 21
+        for number, implication_type, relevance, reason, entity_key, trigger in _INFERENCE_RULES:
+            if entities.get(entity_key) or trigger.search(document_text):
+                article_context = self._get_article_context(number)
+                if article_context:
+                    inferred.append(ArticleAnalysis(
+                        article_id=f"article_{number}",
+                        relevance_score=relevance,
+                        context=article_context,
+                        implication_type=implication_type,
+                        inference_reason=reason
+                    ))
         
         return inferred
     
@@ -392,18 +610,17 @@ class ConstitutionalReasoningEngine:
             return "weak"
     
     def _extract_article_number(self, article_id: str) -> int:
-        """Extract article number from article ID"""
-        try:
-            return int(article_id.replace("article_", ""))
-        except:
-            return 0
+        """Extract article number from article ID ("article_<number>" or a bare number)"""
+        article_id = str(article_id)
+        suffix = article_id[8:] if article_id.startswith("article_") else article_id
+        return int(suffix) if suffix.isdecimal() else 0
     
-    def _identify_constitutional_conflicts(self, fundamental_rights: List[int], directive_principles: List[int]) -> List[str]:
+    def _identify_constitutional_conflicts(self, fundamental_rights: AbstractSet[int], directive_principles: AbstractSet[int]) -> List[str]:
         """Identify potential constitutional conflicts"""
         conflicts = []
         
         # Check for common conflicts
-        if 14 in fundamental_rights and any(dp in range(38, 48) for dp in directive_principles):
+        if 14 in fundamental_rights and directive_principles & _DP_SOCIAL_JUSTICE:
             conflicts.append("Potential conflict between equality (Art 14) and social justice directives")
         
         if 19 in fundamental_rights and 39 in directive_principles:
@@ -416,7 +633,7 @@ class ConstitutionalReasoningEngine:
         if 21 in fundamental_rights and 47 in directive_principles:
             conflicts.append("Potential conflict between personal liberty (Art 21) and state health policies (Art 47)")
         
-        if 25 in fundamental_rights and any(dp in [44, 48] for dp in directive_principles):
+        if 25 in fundamental_rights and directive_principles & _DP_SECULAR_EDUCATION:
             conflicts.append("Potential conflict between religious freedom (Art 25) and secular education policies")
         
         return conflicts
@@ -425,71 +642,69 @@ class ConstitutionalReasoningEngine:
         """Determine approaches to resolve constitutional conflicts"""
         resolutions = []
         for conflict in conflicts:
-            if "equality" in conflict.lower():
-                resolutions.append("Apply harmonious construction principle")
-            elif "trade" in conflict.lower():
-                resolutions.append("Apply proportionality test")
-            else:
-                resolutions.append("Apply balancing of interests approach")
+            conflict_lower = conflict.lower()
+            resolutions.append(next(
+                (resolution for keyword, resolution in _CONFLICT_KEYWORD_MAP.items() if keyword in conflict_lower),
+                "Apply balancing of interests approach"
+            ))
         return resolutions
     
-    def _generate_executive_summary(self, articles: List[Dict], pathways: List[Dict], hierarchy: Dict) -> str:
+    def _generate_executive_summary(self, article_stats: ArticleStats, pathway_stats: PathwayStats, hierarchy: Dict) -> str:
         """Generate executive summary of constitutional analysis"""
-        summary = f"Constitutional analysis identified {len(articles)} relevant articles "
-        summary += f"with {len(pathways)} reasoning pathways. "
+        summary = f"Constitutional analysis identified {article_stats.total} relevant articles "
+        summary += f"with {pathway_stats.total} reasoning pathways. "
         if hierarchy.get("potential_conflicts"):
             summary += f"Found {len(hierarchy['potential_conflicts'])} potential conflicts requiring resolution. "
-        if any(article.get("implication_type") == "privacy_rights" for article in articles):
+        if article_stats.privacy_articles:
             summary += "Privacy rights implications identified under Article 21 framework."
         return summary
     
-    def _generate_article_analysis(self, articles: List[Dict]) -> Dict[str, Any]:
+    def _generate_article_analysis(self, stats: ArticleStats) -> Dict[str, Any]:
         """Generate detailed article analysis"""
         return {
-            "total_articles": len(articles),
+            "total_articles": stats.total,
             "article_breakdown": {
-                "fundamental_rights": len([a for a in articles if a.get("implication_type") == "fundamental_rights"]),
-                "privacy_rights": len([a for a in articles if a.get("implication_type") == "privacy_rights"]),
-                "constitutional_provision": len([a for a in articles if a.get("implication_type") == "constitutional_provision"])
+                "fundamental_rights": stats.implication_counts["fundamental_rights"],
+                "privacy_rights": stats.implication_counts["privacy_rights"],
+                "constitutional_provision": stats.implication_counts["constitutional_provision"]
             },
-            "highest_relevance": max([a.get("relevance_score", 0) for a in articles]) if articles else 0
+            "highest_relevance": stats.highest_relevance
         }
     
-    def _generate_pathway_analysis(self, pathways: List[Dict]) -> Dict[str, Any]:
+    def _generate_pathway_analysis(self, stats: PathwayStats) -> Dict[str, Any]:
         """Generate pathway analysis summary"""
-        if not pathways:
+        if not stats.total:
             return {"total_pathways": 0}
         
         return {
-            "total_pathways": len(pathways),
-            "average_strength": sum([p.get("pathway_strength", 0) for p in pathways]) / len(pathways),
-            "strongest_pathway": max([p.get("pathway_strength", 0) for p in pathways]),
+            "total_pathways": stats.total,
+            "average_strength": float(stats.strengths.mean()),
+            "strongest_pathway": float(stats.strengths.max()),
             "pathway_validity": {
-                validity: len([p for p in pathways if p.get("legal_validity") == validity])
+                validity: stats.validity_counts[validity]
                 for validity in ["strong", "moderate", "weak"]
             }
         }
     
-    def _analyze_privacy_implications_detailed(self, articles: List[Dict], pathways: List[Dict]) -> Dict[str, Any]:
+    def _analyze_privacy_implications_detailed(self, article_stats: ArticleStats, pathway_stats: PathwayStats) -> Dict[str, Any]:
         """Detailed privacy implications analysis"""
-        privacy_articles = [a for a in articles if a.get("implication_type") == "privacy_rights"]
-        privacy_pathways = [p for p in pathways if "privacy" in str(p).lower()]
+        privacy_articles = article_stats.privacy_articles
         
         return {
             "privacy_article_count": len(privacy_articles),
-            "privacy_pathway_count": len(privacy_pathways),
-            "article_21_involved": any("article_21" in a.get("article_id", "") for a in privacy_articles),
-            "privacy_scope_covered": list(set([
+            "privacy_pathway_count": pathway_stats.privacy_count,
+            "article_21_involved": any("article_21" in a.article_id for a in privacy_articles),
+            "privacy_scope_covered": list({
                 scope for article in privacy_articles
-                for scope in article.get("context", {}).get("article", {}).get("privacy_scope", [])
-            ]))
+                for scope in article.context.get("article", {}).get("privacy_scope", [])
+            })
         }
     
-    def _identify_key_principles(self, pathways: List[Dict]) -> List[str]:
+    def _identify_key_principles(self, pathways: List[PathwayResult]) -> List[str]:
         """Identify key constitutional principles from pathways"""
         principles = set()
         for pathway in pathways:
-            for node in pathway.get("pathway_nodes", []):
+            for node in pathway.pathway_nodes:
                 node_type = node.get("type", "")
                 if node_type == "FundamentalRight":
                     principles.add("Fundamental Rights Protection")
@@ -499,31 +714,33 @@ class ConstitutionalReasoningEngine:
                     principles.add("Judicial Precedent")
         return list(principles)
     
-    def _analyze_precedents(self, articles: List[Dict]) -> List[Dict[str, Any]]:
+    def _analyze_precedents(self, articles: List[ArticleAnalysis]) -> List[Dict[str, Any]]:
         """Analyze relevant legal precedents"""
-        precedents = []
-        for article in articles:
-            article_context = article.get("context", {})
-            cases = article_context.get("interpreting_cases", [])
-            for case in cases:
-                precedents.append({
-                    "case_name": case.get("name", "Unknown"),
-                    "significance": case.get("significance", "Unknown"),
-                    "relevance_to_article": article.get("article_id", "Unknown")
-                })
-        return precedents[:5]  # Top 5 most relevant
-    
-    def _generate_compliance_recommendations(self, articles: List[Dict], pathways: List[Dict], hierarchy: Dict) -> List[str]:
+        cases = (
+            (article.article_id, case)
+            for article in articles
+            for case in article.context.get("interpreting_cases", [])
+        )
+        # Top 5 most relevant; stop walking cases once five are found
+        return [
+            {
+                "case_name": case.get("name", "Unknown"),
+                "significance": case.get("significance", "Unknown"),
+                "relevance_to_article": article_id
+            }
+            for article_id, case in islice(cases, 5)
+        ]
+    
+    def _generate_compliance_recommendations(self, article_stats: ArticleStats, pathway_stats: PathwayStats, hierarchy: Dict) -> List[str]:
         """Generate compliance recommendations"""
         recommendations = []
         
         # Article-based recommendations
-        if any(a.get("relevance_score", 0) < 0.6 for a in articles):
+        if article_stats.has_weak_article:
             recommendations.append("Strengthen constitutional basis for provisions")
         
         # Pathway-based recommendations
-        weak_pathways = [p for p in pathways if p.get("pathway_strength", 0) < 0.5]
-        if weak_pathways:
+        if (pathway_stats.strengths < 0.5).any():
             recommendations.append("Reinforce constitutional reasoning pathways")
         
         # Hierarchy-based recommendations
@@ -532,23 +749,22 @@ class ConstitutionalReasoningEngine:
         
         return recommendations
     
-    def _calculate_privacy_compliance_score(self, articles: List[Dict], pathways: List[Dict]) -> float:
+    def _calculate_privacy_compliance_score(self, article_stats: ArticleStats) -> float:
         """Calculate privacy-specific compliance score"""
-        privacy_articles = [a for a in articles if a.get("implication_type") == "privacy_rights"]
+        privacy_articles = article_stats.privacy_articles
         if not privacy_articles:
             return 0.5  # Neutral score if no privacy articles
         
         # Average relevance score of privacy articles
-        privacy_scores = [a.get("relevance_score", 0) for a in privacy_articles]
-        return sum(privacy_scores) / len(privacy_scores)
+        return sum(a.relevance_score for a in privacy_articles) / len(privacy_articles)
     
-    def _calculate_precedent_alignment_score(self, articles: List[Dict]) -> float:
+    def _calculate_precedent_alignment_score(self, articles: List[ArticleAnalysis]) -> float:
         """Calculate precedent alignment score"""
         total_cases = 0
         high_significance_cases = 0
         
         for article in articles:
-            cases = article.get("context", {}).get("interpreting_cases", [])
+            cases = article.context.get("interpreting_cases", [])
             total_cases += len(cases)
             for case in cases:
                 if case.get("significance", "").lower() in ["landmark", "constitutional", "precedent"]:
@@ -570,7 +786,7 @@ class ConstitutionalReasoningEngine:
         else:
             return "Poor compliance with major constitutional concerns"
     
-    def _generate_error_response(self, document_id: str, error_message: str) -> Dict[str, Any]:
+    def _generate_error_response(self, document_id: str, error_message: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Generate error response for failed analysis"""
         return {
             "document_id": document_id,
@@ -579,5 +795,5 @@ class ConstitutionalReasoningEngine:
             "constitutional_articles": [],
             "constitutional_pathways": [],
             "compliance_score": {"overall_score": 0, "error": True},
-            "analysis_timestamp": datetime.now().isoformat()
+            "analysis_timestamp": timestamp or datetime.now().isoformat()
         }
@@ -2,152 +2,537 @@
 DPDPA 2023 Compliance Engine with Constitutional Integration - Complete Updated Version
 """
 
+import bisect
+import copy
+import hashlib
+import json
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from datetime import datetime
+from itertools import islice
+import numpy as np
 from .knowledge_graph.neo4j_manager import ConstitutionalKnowledgeGraph
 from .kag_engine.privacy_analyzer import Article21PrivacyAnalyzer
 
+# Multi-pattern keyword matching with graceful fallback
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-class DPDPAComplianceEngine:
-    """DPDPA 2023 compliance assessment with constitutional foundation"""
-    
-    def __init__(self):
-        try:
-            self.kg = ConstitutionalKnowledgeGraph()
-        except Exception as e:
-            logger.warning(f"Knowledge graph not available: {str(e)}")
-            self.kg = None
-            
-        try:
-            self.privacy_analyzer = Article21PrivacyAnalyzer()
-        except Exception as e:
-            logger.warning(f"Privacy analyzer not available: {str(e)}")
-            self.privacy_analyzer = None
-            
-        self.dpdpa_provisions = self._load_dpdpa_framework()
-        self.compliance_matrix = self._initialize_compliance_matrix()
-    
-    def _load_dpdpa_framework(self) -> Dict[str, Dict[str, Any]]:
-        """Load comprehensive DPDPA 2023 framework"""
-        return {
-            "chapter_1": {
-                "title": "Preliminary",
-                "sections": {
-                    "section_1": {
-                        "title": "Short title and commencement",
-                        "constitutional_relevance": "low",
-                        "privacy_impact": "none"
-                    },
-                    "section_2": {
-                        "title": "Definitions",
-                        "key_definitions": [
-                            "Data Principal", "Data Fiduciary", "Personal Data",
-                            "Processing", "Consent", "Digital Personal Data"
-                        ],
-                        "constitutional_relevance": "high",
-                        "privacy_impact": "foundational"
-                    }
-                }
+# Comprehensive DPDPA 2023 framework (read-only, shared by all engines)
+_DPDPA_PROVISIONS = MappingProxyType({
+    "chapter_1": {
+        "title": "Preliminary",
+        "sections": {
+            "section_1": {
+                "title": "Short title and commencement",
+                "constitutional_relevance": "low",
+                "privacy_impact": "none"
             },
-            "chapter_2": {
-                "title": "Obligations of Data Fiduciary",
-                "sections": {
-                    "section_5": {
-                        "title": "Grounds for processing personal data",
-                        "requirements": [
-                            "Lawful processing", "Purpose specification", "Data minimization",
-                            "Accuracy", "Storage limitation", "Integrity and confidentiality"
-                        ],
-                        "constitutional_basis": ["article_21", "article_14"],
-                        "privacy_impact": "critical",
-                        "compliance_indicators": [
-                            "clear legal basis", "explicit purpose", "minimal data collection",
-                            "data accuracy measures", "retention policies", "security measures"
-                        ]
-                    },
-                    "section_8": {
-                        "title": "Duties of Data Fiduciary",
-                        "requirements": [
-                            "Fair and reasonable processing", "Technical safeguards",
-                            "Organizational measures", "Data breach notification",
-                            "Data protection impact assessment"
-                        ],
-                        "constitutional_basis": ["article_21"],
-                        "privacy_impact": "critical",
-                        "compliance_indicators": [
-                            "fairness assessment", "technical security", "organizational policies",
-                            "breach response procedures", "impact assessment processes"
-                        ]
-                    }
-                }
+            "section_2": {
+                "title": "Definitions",
+                "key_definitions": (
+                    "Data Principal", "Data Fiduciary", "Personal Data",
+                    "Processing", "Consent", "Digital Personal Data"
+                ),
+                "constitutional_relevance": "high",
+                "privacy_impact": "foundational"
+            }
+        }
+    },
+    "chapter_2": {
+        "title": "Obligations of Data Fiduciary",
+        "sections": {
+            "section_5": {
+                "title": "Grounds for processing personal data",
+                "requirements": (
+                    "Lawful processing", "Purpose specification", "Data minimization",
+                    "Accuracy", "Storage limitation", "Integrity and confidentiality"
+                ),
+                "constitutional_basis": ("article_21", "article_14"),
+                "privacy_impact": "critical",
+                "compliance_indicators": (
+                    "clear legal basis", "explicit purpose", "minimal data collection",
+                    "data accuracy measures", "retention policies", "security measures"
+                )
             },
-            "chapter_3": {
-                "title": "Rights and Duties of Data Principal",
-                "sections": {
-                    "section_11": {
-                        "title": "Rights of Data Principal",
-                        "rights": [
-                            "Right to information", "Right to correction", "Right to erasure",
-                            "Right to grievance redressal", "Right to nominate"
-                        ],
-                        "constitutional_basis": ["article_21", "article_19"],
-                        "privacy_impact": "high"
-                    }
-                }
+            "section_8": {
+                "title": "Duties of Data Fiduciary",
+                "requirements": (
+                    "Fair and reasonable processing", "Technical safeguards",
+                    "Organizational measures", "Data breach notification",
+                    "Data protection impact assessment"
+                ),
+                "constitutional_basis": ("article_21",),
+                "privacy_impact": "critical",
+                "compliance_indicators": (
+                    "fairness assessment", "technical security", "organizational policies",
+                    "breach response procedures", "impact assessment processes"
+                )
             }
         }
+    },
+    "chapter_3": {
+        "title": "Rights and Duties of Data Principal",
+        "sections": {
+            "section_11": {
+                "title": "Rights of Data Principal",
+                "rights": (
+                    "Right to information", "Right to correction", "Right to erasure",
+                    "Right to grievance redressal", "Right to nominate"
+                ),
+                "constitutional_basis": ("article_21", "article_19"),
+                "privacy_impact": "high"
+            }
+        }
+    }
+})
+
+# Compliance assessment matrix
+_COMPLIANCE_MATRIX = MappingProxyType({
+    "consent_management": {
+        "weight": 0.25,
+        "constitutional_source": "article_21",
+        "puttaswamy_principle": "Informational Self-Determination",
+        "assessment_criteria": (
+            "explicit_consent", "informed_consent", "specific_consent",
+            "withdrawable_consent", "granular_consent"
+        )
+    },
+    "data_minimization": {
+        "weight": 0.20,
+        "constitutional_source": "article_21",
+        "puttaswamy_principle": "Data Minimization",
+        "assessment_criteria": (
+            "purpose_limitation", "collection_limitation", "use_limitation",
+            "retention_limitation", "disclosure_limitation"
+        )
+    },
+    "security_safeguards": {
+        "weight": 0.20,
+        "constitutional_source": "article_21",
+        "puttaswamy_principle": "Security and Integrity",
+        "assessment_criteria": (
+            "technical_measures", "organizational_measures", "access_controls",
+            "encryption", "breach_prevention"
+        )
+    },
+    "transparency": {
+        "weight": 0.15,
+        "constitutional_source": "article_21",
+        "puttaswamy_principle": "Transparency and Accountability",
+        "assessment_criteria": (
+            "privacy_notice", "processing_disclosure", "rights_information",
+            "contact_details", "complaint_mechanisms"
+        )
+    },
+    "data_subject_rights": {
+        "weight": 0.20,
+        "constitutional_source": "article_21",
+        "puttaswamy_principle": "Individual Rights",
+        "assessment_criteria": (
+            "access_rights", "correction_rights", "erasure_rights",
+            "portability_rights", "objection_rights"
+        )
+    }
+})
+
+# Keywords behind the Section 5/8 requirement checks, keyed by scan category
+_CHECK_KEYWORDS = {
+    "lawful_basis": frozenset({"consent", "contract", "legal obligation", "legitimate interest", "vital interest"}),
+    "purpose": frozenset({"purpose", "objective", "reason", "use", "processing for"}),
+    "minimization": frozenset({"necessary", "minimal", "required", "essential", "limited", "specific purpose"}),
+    "accuracy": frozenset({"accurate", "correct", "up-to-date", "verify", "validation"}),
+    "storage": frozenset({"retention", "storage period", "delete", "expire", "archive"}),
+    "integrity": frozenset({"security", "confidentiality", "integrity", "encrypt", "secure", "protection"}),
+    "fairness": frozenset({"fair", "reasonable", "transparent", "lawful", "proportionate"}),
+    "technical": frozenset({"encryption", "firewall", "access control", "authentication", "technical measures"}),
+    "organizational": frozenset({"policy", "procedure", "training", "staff", "organizational measures"}),
+    "breach": frozenset({"breach", "notification", "incident", "report", "alert"}),
+    "impact": frozenset({"impact assessment", "privacy impact", "DPIA", "assessment", "evaluation"})
+}
+
+# Section 11 data principal rights
+_RIGHTS_KEYWORDS = {
+    "right_to_information": frozenset({"information", "notice", "inform", "disclosure"}),
+    "right_to_correction": frozenset({"correct", "rectify", "update", "modify"}),
+    "right_to_erasure": frozenset({"delete", "erase", "remove", "forget"}),
+    "right_to_grievance_redressal": frozenset({"complaint", "grievance", "redressal", "appeal"}),
+    "right_to_nominate": frozenset({"nominate", "nomination", "representative", "delegate"})
+}
+
+# Compliance matrix criteria; criteria not listed here match their own name
+_CRITERION_KEYWORDS = {
+    "explicit_consent": frozenset({"explicit consent", "clear consent", "unambiguous consent"}),
+    "informed_consent": frozenset({"informed consent", "information provided", "notice given"}),
+    "specific_consent": frozenset({"specific consent", "purpose-specific", "granular consent"}),
+    "withdrawable_consent": frozenset({"withdraw consent", "revoke consent", "opt-out"}),
+    "granular_consent": frozenset({"granular consent", "specific purpose", "choice"}),
+    "purpose_limitation": frozenset({"purpose limitation", "specific purpose", "intended use"}),
+    "collection_limitation": frozenset({"collection limitation", "minimal collection", "necessary data"}),
+    "technical_measures": frozenset({"encryption", "security", "technical safeguards"}),
+    "organizational_measures": frozenset({"policies", "procedures", "training"}),
+    "access_rights": frozenset({"access", "right to access", "data subject access"}),
+    "correction_rights": frozenset({"correction", "rectification", "update"}),
+    "erasure_rights": frozenset({"deletion", "erasure", "right to be forgotten"}),
+    "privacy_notice": frozenset({"privacy notice", "privacy policy", "information notice"}),
+    "processing_disclosure": frozenset({"processing disclosure", "data use", "purpose disclosure"})
+}
+
+# Basic compliance indicators for sections without a dedicated assessment
+_GENERIC_COMPLIANCE_KEYWORDS = frozenset({
+    "data protection", "personal data", "consent", "lawful basis",
+    "data subject", "data controller", "processing", "privacy policy"
+})
+
+# Keyword x category membership matrix: a document's per-category hit counts
+# are its keyword hit vector times this matrix
+_KEYWORD_GROUPS = {
+    **_CHECK_KEYWORDS, **_RIGHTS_KEYWORDS,
+    # Matrix criteria without their own keywords match their name ("contact_details" -> "contact details")
+    **{
+        criterion: frozenset({criterion.replace("_", " ")})
+        for criteria in _COMPLIANCE_MATRIX.values() for criterion in criteria["assessment_criteria"]
+    },
+    **_CRITERION_KEYWORDS,
+    "generic_compliance": _GENERIC_COMPLIANCE_KEYWORDS
+}
+_SCAN_CATEGORIES = tuple(_KEYWORD_GROUPS)
+_SCAN_KEYWORDS = tuple(sorted(set().union(*_KEYWORD_GROUPS.values())))
+_KEYWORD_MEMBERSHIP = np.array(
+    [[keyword in _KEYWORD_GROUPS[category] for category in _SCAN_CATEGORIES] for keyword in _SCAN_KEYWORDS],
+    dtype=np.int32
+)
+
+def _build_keyword_automaton():
+    """Aho-Corasick automaton over all assessment keywords, valued by keyword index"""
+    automaton = ahocorasick.Automaton()
+    for index, keyword in enumerate(_SCAN_KEYWORDS):
+        automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Regex fallback: the lookahead reports the longest keyword starting at every position,
+# and _KEYWORD_CONTAINS[i, j] (keyword j occurs inside keyword i) recovers the shorter
+# keywords hidden inside each match, so hits equal plain substring search
+_KEYWORD_INDEX = {keyword: index for index, keyword in enumerate(_SCAN_KEYWORDS)}
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_SCAN_KEYWORDS, key=len, reverse=True))) + "))"
+)
+_KEYWORD_CONTAINS = np.array(
+    [[inner in outer for inner in _SCAN_KEYWORDS] for outer in _SCAN_KEYWORDS],
+    dtype=bool
+)
+
+# Keyword score per category: base + step per distinct keyword found, capped at 1.0.
+# Categories without a rule score the fraction of their keywords found.
+# Purpose specification is scored by keyword density instead (see _check_purpose_specification).
+_SCORE_RULES = {
+    "lawful_basis": (0.0, 0.2),
+    "minimization": (0.0, 0.15),
+    "accuracy": (0.3, 0.15),
+    "storage": (0.2, 0.2),
+    "integrity": (0.2, 0.15),
+    "fairness": (0.3, 0.15),
+    "technical": (0.2, 0.2),
+    "organizational": (0.2, 0.2),
+    "breach": (0.1, 0.2),
+    "impact": (0.1, 0.2),
+    **{right: (0.2, 0.2) for right in _RIGHTS_KEYWORDS}
+}
+_CATEGORY_RULES = [
+    _SCORE_RULES.get(category, (0.0, 1.0 / len(_KEYWORD_GROUPS[category])))
+    for category in _SCAN_CATEGORIES
+]
+
+def _build_score_table() -> np.ndarray:
+    """Category score by hit count, accumulated with += so floats match the per-keyword loop"""
+    table = np.ones((len(_SCAN_CATEGORIES), len(_SCAN_KEYWORDS) + 1))
+    for row, (category, (base, step)) in enumerate(zip(_SCAN_CATEGORIES, _CATEGORY_RULES)):
+        score = base
+        for count in range(len(_KEYWORD_GROUPS[category]) + 1):
+            table[row, count] = min(score, 1.0)
+            score += step
+    return table
+
+# _SCORE_TABLE[category, hits]; base + step * hits rounds differently (0.7000000000000001 vs 0.7)
+_SCORE_TABLE = _build_score_table()
+_CATEGORY_INDEX = np.arange(len(_SCAN_CATEGORIES))
+
+def _scan_keywords(text_lower: str) -> np.ndarray:
+    """Keyword hit vector (one flag per _SCAN_KEYWORDS entry) from one pass over the lowercased text"""
+    if _KEYWORD_AUTOMATON is not None:
+        hits = np.zeros(len(_SCAN_KEYWORDS), dtype=bool)
+        for _, index in _KEYWORD_AUTOMATON.iter(text_lower):
+            hits[index] = True
+        return hits
+    matched = {_KEYWORD_INDEX[keyword] for keyword in _KEYWORD_RE.findall(text_lower)}
+    if not matched:
+        return np.zeros(len(_SCAN_KEYWORDS), dtype=bool)
+    return _KEYWORD_CONTAINS[list(matched)].any(axis=0)
+
+def _document_digest(document_text: str) -> bytes:
+    """Cache key for a document's text"""
+    return hashlib.blake2b(document_text.encode(), digest_size=16).digest()
+
+def _without_timestamps(value: Any) -> Any:
+    """Copy of a nested analysis with its *timestamp* fields dropped (they differ on every run)"""
+    if isinstance(value, dict):
+        return {key: _without_timestamps(item) for key, item in value.items() if "timestamp" not in str(key)}
+    if isinstance(value, (list, tuple)):
+        return [_without_timestamps(item) for item in value]
+    return value
+
+def _assessment_key(digest: bytes, privacy_analysis: Optional[Dict[str, Any]]) -> Optional[bytes]:
+    """Result cache key: the document digest plus a digest of the privacy analysis it was assessed with"""
+    if not privacy_analysis:
+        return digest
+    try:
+        analysis_json = json.dumps(_without_timestamps(privacy_analysis), sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        # Unserializable analysis: assess without caching
+        return None
+    return digest + hashlib.blake2b(analysis_json.encode(), digest_size=16).digest()
+
+@dataclass(slots=True)
+class _PreparedDoc:
+    """Document text lowercased and keyword-scanned once per assessment"""
+    raw: str
+    lower: str
+    keyword_hits: Dict[str, int]
+    keyword_scores: Dict[str, float]
+    
+    @classmethod
+    def from_text(cls, document_text: str) -> "_PreparedDoc":
+        return cls.from_texts([document_text])[0]
+    
+    @classmethod
+    def from_texts(cls, documents: List[str]) -> List["_PreparedDoc"]:
+        """Prepare a batch, counting every category of every document in one matrix product"""
+        if not documents:
+            return []
+        lowered = [text.lower() for text in documents]
+        hits = np.vstack([_scan_keywords(text) for text in lowered])
+        counts = hits @ _KEYWORD_MEMBERSHIP
+        scores = _SCORE_TABLE[_CATEGORY_INDEX, counts]
+        return [
+            cls(
+                raw=raw,
+                lower=text_lower,
+                keyword_hits=dict(zip(_SCAN_CATEGORIES, doc_counts)),
+                keyword_scores=dict(zip(_SCAN_CATEGORIES, doc_scores))
+            )
+            for raw, text_lower, doc_counts, doc_scores
+            in zip(documents, lowered, counts.tolist(), scores.tolist())
+        ]
+
+@dataclass(slots=True)
+class SectionAssessment:
+    """Compliance assessment of one DPDPA section"""
+    section_id: str
+    title: str
+    constitutional_basis: List[str]
+    privacy_impact: str
+    compliance_score: float = 0.0
+    compliance_status: str = "not_assessed"
+    findings: List[str] = field(default_factory=list)
+    gaps: List[str] = field(default_factory=list)
+    requirement_scores: Optional[Dict[str, float]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "section_id": self.section_id,
+            "title": self.title,
+            "compliance_score": self.compliance_score,
+            "compliance_status": self.compliance_status,
+            "findings": self.findings,
+            "gaps": self.gaps,
+            "constitutional_basis": self.constitutional_basis,
+            "privacy_impact": self.privacy_impact
+        }
+        if self.requirement_scores is not None:
+            data["requirement_scores"] = self.requirement_scores
+        return data
+
+@dataclass(slots=True)
+class MatrixCategoryAssessment:
+    """Compliance matrix assessment of one category"""
+    category: str
+    weight: float
+    constitutional_source: str
+    puttaswamy_principle: str
+    assessment_score: float = 0.0
+    evidence: List[str] = field(default_factory=list)
+    gaps: List[str] = field(default_factory=list)
+    criteria_scores: Dict[str, float] = field(default_factory=dict)
     
-    def _initialize_compliance_matrix(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize compliance assessment matrix"""
+    def to_dict(self) -> Dict[str, Any]:
         return {
-            "consent_management": {
-                "weight": 0.25,
-                "constitutional_source": "article_21",
-                "puttaswamy_principle": "Informational Self-Determination",
-                "assessment_criteria": [
-                    "explicit_consent", "informed_consent", "specific_consent",
-                    "withdrawable_consent", "granular_consent"
-                ]
-            },
-            "data_minimization": {
-                "weight": 0.20,
-                "constitutional_source": "article_21",
-                "puttaswamy_principle": "Data Minimization",
-                "assessment_criteria": [
-                    "purpose_limitation", "collection_limitation", "use_limitation",
-                    "retention_limitation", "disclosure_limitation"
-                ]
-            },
-            "security_safeguards": {
-                "weight": 0.20,
-                "constitutional_source": "article_21",
-                "puttaswamy_principle": "Security and Integrity",
-                "assessment_criteria": [
-                    "technical_measures", "organizational_measures", "access_controls",
-                    "encryption", "breach_prevention"
-                ]
-            },
-            "transparency": {
-                "weight": 0.15,
-                "constitutional_source": "article_21",
-                "puttaswamy_principle": "Transparency and Accountability",
-                "assessment_criteria": [
-                    "privacy_notice", "processing_disclosure", "rights_information",
-                    "contact_details", "complaint_mechanisms"
-                ]
+            "category": self.category,
+            "weight": self.weight,
+            "constitutional_source": self.constitutional_source,
+            "puttaswamy_principle": self.puttaswamy_principle,
+            "assessment_score": self.assessment_score,
+            "evidence": self.evidence,
+            "gaps": self.gaps,
+            "criteria_scores": self.criteria_scores
+        }
+
+@dataclass(slots=True)
+class DPDPAResult:
+    """Full DPDPA assessment of a document; serialized with to_dict() at the API boundary"""
+    section_compliance: Dict[str, SectionAssessment]
+    matrix_assessment: Dict[str, MatrixCategoryAssessment]
+    constitutional_alignment: Dict[str, Any]
+    compliance_risks: Dict[str, Any]
+    recommendations: List[str]
+    overall_score: Dict[str, Any]
+    compliance_status: str
+    assessment_timestamp: str
+    privacy_analysis_integration: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dpdpa_compliance_summary": {
+                "overall_score": self.overall_score["overall_score"],
+                "compliance_status": self.compliance_status,
+                "constitutional_alignment": self.constitutional_alignment["alignment_score"],
+                "critical_gaps": self.compliance_risks.get("critical_issues", [])
             },
-            "data_subject_rights": {
-                "weight": 0.20,
-                "constitutional_source": "article_21",
-                "puttaswamy_principle": "Individual Rights",
-                "assessment_criteria": [
-                    "access_rights", "correction_rights", "erasure_rights",
-                    "portability_rights", "objection_rights"
-                ]
-            }
+            "section_compliance": {section_id: section.to_dict() for section_id, section in self.section_compliance.items()},
+            "matrix_assessment": {category: data.to_dict() for category, data in self.matrix_assessment.items()},
+            "constitutional_alignment": self.constitutional_alignment,
+            "compliance_risks": self.compliance_risks,
+            "recommendations": self.recommendations,
+            "overall_score": self.overall_score,
+            "assessment_timestamp": self.assessment_timestamp,
+            "privacy_analysis_integration": self.privacy_analysis_integration
         }
+
+@dataclass(slots=True)
+class DPDPAErrorResult:
+    """Failed DPDPA assessment; serialized with to_dict() like DPDPAResult"""
+    error_message: str
+    assessment_timestamp: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "error": True,
+            "error_message": self.error_message,
+            "dpdpa_compliance_summary": {"overall_score": 0, "error": True},
+            "assessment_timestamp": self.assessment_timestamp
+        }
+
+# Category weights in matrix order, for the weighted matrix score
+_MATRIX_WEIGHTS = np.array([criteria["weight"] for criteria in _COMPLIANCE_MATRIX.values()])
+
+# Section 8 duties, in assessment order
+_SECTION_8_REQUIREMENTS = (
+    "fair_reasonable_processing", "technical_safeguards", "organizational_measures",
+    "breach_notification", "impact_assessment"
+)
+
+# Section 11 rights of the Data Principal, in assessment order
+_SECTION_11_RIGHTS = tuple(_RIGHTS_KEYWORDS)
+
+# Display labels for requirement, right and criterion keys ("right_to_erasure" -> "Right To Erasure")
+_PRETTY_LABELS = {
+    key: key.replace("_", " ").title()
+    for key in (
+        *_SECTION_8_REQUIREMENTS,
+        *_RIGHTS_KEYWORDS,
+        *(criterion for criteria in _COMPLIANCE_MATRIX.values() for criterion in criteria["assessment_criteria"])
+    )
+}
+
+# Score bands (ascending lower bounds); bisect_right picks the band a score falls in
+_STATUS_THRESHOLDS = (40, 60, 80)
+_STATUS_BANDS = ("non_compliant", "partially_compliant", "substantially_compliant", "fully_compliant")
+_SCORE_INTERPRETATIONS = (
+    "Poor compliance with major gaps requiring immediate attention",
+    "Moderate compliance requiring significant improvements",
+    "Good compliance with some areas for improvement",
+    "Excellent DPDPA compliance with strong constitutional alignment"
+)
+_GRADE_THRESHOLDS = (50, 60, 70, 80, 90)
+_GRADES = ("F", "D", "C", "B", "A", "A+")
+
+# Recent assessments kept per engine
+_ASSESSMENT_CACHE_SIZE = 128
+
+class DPDPAComplianceEngine:
+    """DPDPA 2023 compliance assessment with constitutional foundation"""
+    
+    def __init__(self):
+        # Knowledge graph and privacy analyzer are built on first use; a failed build isn't retried
+        self._kg = None
+        self._kg_failed = False
+        self._privacy_analyzer = None
+        self._privacy_analyzer_failed = False
+        
+        self.dpdpa_provisions = _DPDPA_PROVISIONS
+        self.compliance_matrix = _COMPLIANCE_MATRIX
+        # Full results keyed by document and privacy analysis (see _assessment_key)
+        self._assessment_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        # The app shares one engine between sessions, so cache updates are serialized
+        self._cache_lock = threading.Lock()
+        # Sections with a dedicated assessment; the rest get the generic one
+        self._section_dispatch = {
+            "section_5": self._assess_section_5_compliance,
+            "section_8": self._assess_section_8_compliance,
+            "section_11": self._assess_section_11_compliance
+        }
+        # Provisions flattened once into (section_id, title, basis, impact, assess) rows
+        self._section_plan = tuple(
+            (
+                section_id,
+                section_data["title"],
+                tuple(section_data.get("constitutional_basis", ())),
+                section_data.get("privacy_impact", "unknown"),
+                self._section_dispatch.get(section_id, self._assess_generic_section_compliance)
+            )
+            for chapter_data in self.dpdpa_provisions.values()
+            for section_id, section_data in chapter_data.get("sections", {}).items()
+        )
+    
+    @property
+    def kg(self) -> Optional[ConstitutionalKnowledgeGraph]:
+        """Knowledge graph, connected on first access"""
+        if self._kg is None and not self._kg_failed:
+            try:
+                self._kg = ConstitutionalKnowledgeGraph()
+            except Exception as e:
+                logger.warning(f"Knowledge graph not available: {str(e)}")
+                self._kg_failed = True
+        return self._kg
+    
+    @property
+    def privacy_analyzer(self) -> Optional[Article21PrivacyAnalyzer]:
+        """Article 21 privacy analyzer, built on first access"""
+        if self._privacy_analyzer is None and not self._privacy_analyzer_failed:
+            try:
+                self._privacy_analyzer = Article21PrivacyAnalyzer()
+            except Exception as e:
+                logger.warning(f"Privacy analyzer not available: {str(e)}")
+                self._privacy_analyzer_failed = True
+        return self._privacy_analyzer
     
     def assess_dpdpa_compliance(self, document_text: str, privacy_analysis: Dict[str, Any] = None) -> Dict[str, Any]:
         """Comprehensive DPDPA compliance assessment"""
@@ -155,110 +540,161 @@ class DPDPAComplianceEngine:
         logger.info("📋 Starting DPDPA 2023 compliance assessment...")
         
         try:
-            # Use existing privacy analysis or generate new one
-            if not privacy_analysis and self.privacy_analyzer:
-                privacy_analysis = self.privacy_analyzer.analyze_privacy_implications(document_text)
-            elif not privacy_analysis:
-                privacy_analysis = {}
+            # Reuse the assessment of an identical document assessed against the same privacy analysis
+            digest = _document_digest(document_text)
+            cache_key = _assessment_key(digest, privacy_analysis)
+            if cache_key is not None:
+                with self._cache_lock:
+                    cached = self._assessment_cache.get(cache_key)
+                    if cached is not None:
+                        self._assessment_cache.move_to_end(cache_key)
+                if cached is not None:
+                    result = copy.deepcopy(cached)
+                    now = datetime.now().isoformat(timespec="seconds")
+                    result["assessment_timestamp"] = now
+                    result["overall_score"]["calculation_timestamp"] = now
+                    # The key ignores timestamps, so point at the analysis actually passed in
+                    if privacy_analysis:
+                        result["privacy_analysis_integration"] = privacy_analysis.get("analysis_timestamp")
+                    return result
             
-            # Step 1: Section-by-section compliance assessment
-            section_compliance = self._assess_section_compliance(document_text, privacy_analysis)
+            # Gather the privacy analysis and scanned document once for every helper
+            ctx = self._build_assessment_context(document_text, privacy_analysis, _PreparedDoc.from_text(document_text))
             
-            # Step 2: Apply compliance matrix
-            matrix_assessment = self._apply_compliance_matrix(document_text, privacy_analysis)
+            result = self._run_assessment(ctx, datetime.now().isoformat(timespec="seconds")).to_dict()
             
-            # Step 3: Constitutional alignment check
-            constitutional_alignment = self._check_constitutional_alignment(
-                section_compliance, matrix_assessment, privacy_analysis
-            )
-            
-            # Step 4: Risk assessment
-            compliance_risks = self._assess_compliance_risks(
-                section_compliance, matrix_assessment, constitutional_alignment
-            )
-            
-            # Step 5: Generate recommendations
-            recommendations = self._generate_dpdpa_recommendations(
-                section_compliance, matrix_assessment, compliance_risks
-            )
-            
-            # Step 6: Calculate overall compliance score
-            overall_score = self._calculate_dpdpa_compliance_score(
-                section_compliance, matrix_assessment, constitutional_alignment
-            )
-            
-            return {
-                "dpdpa_compliance_summary": {
-                    "overall_score": overall_score["overall_score"],
-                    "compliance_status": self._determine_compliance_status(overall_score["overall_score"]),
-                    "constitutional_alignment": constitutional_alignment["alignment_score"],
-                    "critical_gaps": compliance_risks.get("critical_issues", [])
-                },
-                "section_compliance": section_compliance,
-                "matrix_assessment": matrix_assessment,
-                "constitutional_alignment": constitutional_alignment,
-                "compliance_risks": compliance_risks,
-                "recommendations": recommendations,
-                "overall_score": overall_score,
-                "assessment_timestamp": datetime.now().isoformat(),
-                "privacy_analysis_integration": privacy_analysis.get("analysis_timestamp")
-            }
+            if cache_key is not None:
+                cached = copy.deepcopy(result)
+                with self._cache_lock:
+                    self._assessment_cache[cache_key] = cached
+                    if len(self._assessment_cache) > _ASSESSMENT_CACHE_SIZE:
+                        self._assessment_cache.popitem(last=False)
+            return result
             
         except Exception as e:
             logger.error(f"❌ DPDPA compliance assessment failed: {str(e)}")
             return self._generate_compliance_error_response(str(e))
     
-    def _assess_section_compliance(self, document_text: str, privacy_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def assess_dpdpa_compliance_json(self, document_text: str, privacy_analysis: Dict[str, Any] = None) -> bytes:
+        """DPDPA compliance assessment serialized as UTF-8 JSON bytes"""
+        result = self.assess_dpdpa_compliance(document_text, privacy_analysis)
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(result, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(result, default=str, ensure_ascii=False, separators=(",", ":")).encode()
+    
+    def assess_many(self, documents: List[str], privacy_analyses: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Batch DPDPA compliance assessment, scanning and scoring all documents together"""
+        
+        logger.info(f"📋 Starting DPDPA 2023 compliance assessment of {len(documents)} documents...")
+        
+        # One timestamp for the whole batch, error responses included
+        timestamp = datetime.now().isoformat(timespec="seconds")
+        
+        try:
+            prepared = _PreparedDoc.from_texts(documents)
+        except Exception as e:
+            logger.error(f"❌ DPDPA batch preparation failed: {str(e)}")
+            return [self._generate_compliance_error_response(str(e), timestamp) for _ in documents]
+        
+        results = []
+        for index, (document_text, doc) in enumerate(zip(documents, prepared)):
+            try:
+                privacy_analysis = privacy_analyses[index] if privacy_analyses else None
+                ctx = self._build_assessment_context(document_text, privacy_analysis, doc)
+                results.append(self._run_assessment(ctx, timestamp).to_dict())
+            except Exception as e:
+                logger.error(f"❌ DPDPA compliance assessment failed for document {index}: {str(e)}")
+                results.append(self._generate_compliance_error_response(str(e), timestamp))
+        
+        return results
+    
+    def _run_assessment(self, ctx: Dict[str, Any], timestamp: str) -> DPDPAResult:
+        """Run the assessment steps over a prepared context"""
+        
+        # Step 1: Section-by-section compliance assessment
+        section_compliance = self._assess_section_compliance(ctx)
+        
+        # Step 2: Apply compliance matrix
+        matrix_assessment = self._apply_compliance_matrix(ctx)
+        
+        # Step 3: Constitutional alignment check
+        constitutional_alignment = self._check_constitutional_alignment(
+            section_compliance, matrix_assessment, ctx
+        )
+        
+        # Step 4: Risk assessment
+        compliance_risks = self._assess_compliance_risks(
+            section_compliance, matrix_assessment, constitutional_alignment
+        )
+        
+        # Step 5: Generate recommendations
+        recommendations = self._generate_dpdpa_recommendations(
+            section_compliance, matrix_assessment, compliance_risks
+        )
+        
+        # Step 6: Calculate overall compliance score
+        overall_score = self._calculate_dpdpa_compliance_score(
+            section_compliance, matrix_assessment, constitutional_alignment, timestamp
+        )
+        
+        return DPDPAResult(
+            section_compliance=section_compliance,
+            matrix_assessment=matrix_assessment,
+            constitutional_alignment=constitutional_alignment,
+            compliance_risks=compliance_risks,
+            recommendations=recommendations,
+            overall_score=overall_score,
+            compliance_status=self._determine_compliance_status(overall_score["overall_score"]),
+            assessment_timestamp=timestamp,
+            privacy_analysis_integration=ctx["privacy_analysis"].get("analysis_timestamp")
+        )
+    
+    def clear_cache(self):
+        """Drop memoized assessments (bounds memory in long-running services)"""
+        with self._cache_lock:
+            self._assessment_cache.clear()
+    
+    def _build_assessment_context(self, document_text: str, privacy_analysis: Optional[Dict[str, Any]], doc: Optional[_PreparedDoc] = None) -> Dict[str, Any]:
+        """Prefetch everything the assessment helpers read for one document"""
+        doc = doc or _PreparedDoc.from_text(document_text)
+        
+        # Use existing privacy analysis or generate new one (sharing the lowercased text)
+        if not privacy_analysis and self.privacy_analyzer:
+            privacy_analysis = self.privacy_analyzer.analyze_privacy_implications(document_text, text_lower=doc.lower)
+        elif not privacy_analysis:
+            privacy_analysis = {}
+        
+        return {
+            "doc": doc,
+            "privacy_analysis": privacy_analysis,
+            "article_21_compliance": privacy_analysis.get("constitutional_compliance", {})
+        }
+    
+    def _assess_section_compliance(self, ctx: Dict[str, Any]) -> Dict[str, SectionAssessment]:
         """Assess compliance with specific DPDPA sections"""
         
         section_assessments = {}
         
-        for chapter_id, chapter_data in self.dpdpa_provisions.items():
-            chapter_title = chapter_data["title"]
-            
-            for section_id, section_data in chapter_data.get("sections", {}).items():
-                section_title = section_data["title"]
-                
-                assessment = {
-                    "section_id": section_id,
-                    "title": section_title,
-                    "compliance_score": 0.0,
-                    "compliance_status": "not_assessed",
-                    "findings": [],
-                    "gaps": [],
-                    "constitutional_basis": section_data.get("constitutional_basis", []),
-                    "privacy_impact": section_data.get("privacy_impact", "unknown")
-                }
-                
-                # Assess specific sections
-                if section_id == "section_5":
-                    assessment = self._assess_section_5_compliance(assessment, document_text, privacy_analysis)
-                elif section_id == "section_8":
-                    assessment = self._assess_section_8_compliance(assessment, document_text, privacy_analysis)
-                elif section_id == "section_11":
-                    assessment = self._assess_section_11_compliance(assessment, document_text, privacy_analysis)
-                else:
-                    # Generic assessment for other sections
-                    assessment = self._assess_generic_section_compliance(assessment, document_text)
-                
-                section_assessments[section_id] = assessment
+        for section_id, title, constitutional_basis, privacy_impact, assess in self._section_plan:
+            assessment = SectionAssessment(
+                section_id=section_id,
+                title=title,
+                constitutional_basis=list(constitutional_basis),
+                privacy_impact=privacy_impact
+            )
+            section_assessments[section_id] = assess(assessment, ctx)
         
         return section_assessments
     
-    def _assess_section_5_compliance(self, assessment: Dict, document_text: str, privacy_analysis: Dict) -> Dict:
+    def _assess_section_5_compliance(self, assessment: SectionAssessment, ctx: Dict[str, Any]) -> SectionAssessment:
         """Assess Section 5: Grounds for processing personal data"""
         
-        section_5_requirements = [
-            "lawful_processing", "purpose_specification", "data_minimization",
-            "accuracy", "storage_limitation", "integrity_confidentiality"
-        ]
-        
         compliance_scores = {}
         findings = []
         gaps = []
         
         # Check lawful processing
-        lawful_basis_score = self._check_lawful_processing_basis(document_text, privacy_analysis)
+        lawful_basis_score = self._check_lawful_processing_basis(ctx)
         compliance_scores["lawful_processing"] = lawful_basis_score
         
         if lawful_basis_score >= 0.7:
@@ -267,7 +703,7 @@ class DPDPAComplianceEngine:
             gaps.append("❌ Lawful basis for processing not clearly established")
         
         # Check purpose specification
-        purpose_score = self._check_purpose_specification(document_text, privacy_analysis)
+        purpose_score = self._check_purpose_specification(ctx)
         compliance_scores["purpose_specification"] = purpose_score
         
         if purpose_score >= 0.7:
@@ -276,7 +712,7 @@ class DPDPAComplianceEngine:
             gaps.append("❌ Processing purposes not adequately specified")
         
         # Check data minimization
-        minimization_score = self._check_data_minimization(document_text, privacy_analysis)
+        minimization_score = self._check_data_minimization(ctx)
         compliance_scores["data_minimization"] = minimization_score
         
         if minimization_score >= 0.7:
@@ -285,128 +721,106 @@ class DPDPAComplianceEngine:
             gaps.append("❌ Data minimization not adequately implemented")
         
         # Check accuracy requirements
-        accuracy_score = self._check_accuracy_requirements(document_text)
+        accuracy_score = self._check_accuracy_requirements(ctx)
         compliance_scores["accuracy"] = accuracy_score
         
         # Check storage limitation
-        storage_score = self._check_storage_limitation(document_text)
+        storage_score = self._check_storage_limitation(ctx)
         compliance_scores["storage_limitation"] = storage_score
         
         # Check integrity and confidentiality
-        integrity_score = self._check_integrity_confidentiality(document_text)
+        integrity_score = self._check_integrity_confidentiality(ctx)
         compliance_scores["integrity_confidentiality"] = integrity_score
         
         # Calculate overall section score
         overall_score = sum(compliance_scores.values()) / len(compliance_scores)
         
-        assessment.update({
-            "compliance_score": round(overall_score, 2),
-            "compliance_status": "compliant" if overall_score >= 0.7 else "non_compliant" if overall_score < 0.5 else "partially_compliant",
-            "findings": findings,
-            "gaps": gaps,
-            "requirement_scores": compliance_scores
-        })
+        assessment.compliance_score = round(overall_score, 2)
+        assessment.compliance_status = "compliant" if overall_score >= 0.7 else "non_compliant" if overall_score < 0.5 else "partially_compliant"
+        assessment.findings = findings
+        assessment.gaps = gaps
+        assessment.requirement_scores = compliance_scores
         
         return assessment
     
-    def _assess_section_8_compliance(self, assessment: Dict, document_text: str, privacy_analysis: Dict) -> Dict:
+    def _assess_section_8_compliance(self, assessment: SectionAssessment, ctx: Dict[str, Any]) -> SectionAssessment:
         """Assess Section 8: Duties of Data Fiduciary"""
         
-        section_8_requirements = [
-            "fair_reasonable_processing", "technical_safeguards", "organizational_measures",
-            "breach_notification", "impact_assessment"
-        ]
-        
         compliance_scores = {}
         findings = []
         gaps = []
         
         # Check fair and reasonable processing
-        fairness_score = self._check_fair_reasonable_processing(document_text, privacy_analysis)
+        fairness_score = self._check_fair_reasonable_processing(ctx)
         compliance_scores["fair_reasonable_processing"] = fairness_score
         
         # Check technical safeguards
-        technical_score = self._check_technical_safeguards(document_text, privacy_analysis)
+        technical_score = self._check_technical_safeguards(ctx)
         compliance_scores["technical_safeguards"] = technical_score
         
         # Check organizational measures
-        organizational_score = self._check_organizational_measures(document_text)
+        organizational_score = self._check_organizational_measures(ctx)
         compliance_scores["organizational_measures"] = organizational_score
         
         # Check breach notification
-        breach_score = self._check_breach_notification_procedures(document_text)
+        breach_score = self._check_breach_notification_procedures(ctx)
         compliance_scores["breach_notification"] = breach_score
         
         # Check impact assessment
-        impact_score = self._check_impact_assessment_procedures(document_text)
+        impact_score = self._check_impact_assessment_procedures(ctx)
         compliance_scores["impact_assessment"] = impact_score
         
         # Generate findings and gaps based on scores
         for requirement, score in compliance_scores.items():
             if score >= 0.7:
-                findings.append(f"✅ {requirement.replace('_', ' ').title()} adequately addressed")
+                findings.append(f"✅ {_PRETTY_LABELS[requirement]} adequately addressed")
             else:
-                gaps.append(f"❌ {requirement.replace('_', ' ').title()} needs improvement")
+                gaps.append(f"❌ {_PRETTY_LABELS[requirement]} needs improvement")
         
         # Calculate overall section score
         overall_score = sum(compliance_scores.values()) / len(compliance_scores)
         
-        assessment.update({
-            "compliance_score": round(overall_score, 2),
-            "compliance_status": "compliant" if overall_score >= 0.7 else "non_compliant" if overall_score < 0.5 else "partially_compliant",
-            "findings": findings,
-            "gaps": gaps,
-            "requirement_scores": compliance_scores
-        })
+        assessment.compliance_score = round(overall_score, 2)
+        assessment.compliance_status = "compliant" if overall_score >= 0.7 else "non_compliant" if overall_score < 0.5 else "partially_compliant"
+        assessment.findings = findings
+        assessment.gaps = gaps
+        assessment.requirement_scores = compliance_scores
         
         return assessment
 
-    def _assess_section_11_compliance(self, assessment: Dict, document_text: str, privacy_analysis: Dict) -> Dict:
+    def _assess_section_11_compliance(self, assessment: SectionAssessment, ctx: Dict[str, Any]) -> SectionAssessment:
         """Assess Section 11: Rights of Data Principal"""
         
-        rights_requirements = [
-            "right_to_information", "right_to_correction", "right_to_erasure",
-            "right_to_grievance_redressal", "right_to_nominate"
-        ]
-        
         compliance_scores = {}
         findings = []
         gaps = []
         
         # Check each right
-        for right in rights_requirements:
-            score = self._check_data_principal_right(document_text, right)
+        for right in _SECTION_11_RIGHTS:
+            score = self._check_data_principal_right(ctx, right)
             compliance_scores[right] = score
             
             if score >= 0.6:
-                findings.append(f"✅ {right.replace('_', ' ').title()} addressed")
+                findings.append(f"✅ {_PRETTY_LABELS[right]} addressed")
             else:
-                gaps.append(f"❌ {right.replace('_', ' ').title()} needs implementation")
+                gaps.append(f"❌ {_PRETTY_LABELS[right]} needs implementation")
         
         # Calculate overall section score
         overall_score = sum(compliance_scores.values()) / len(compliance_scores)
         
-        assessment.update({
-            "compliance_score": round(overall_score, 2),
-            "compliance_status": "compliant" if overall_score >= 0.7 else "non_compliant" if overall_score < 0.5 else "partially_compliant",
-            "findings": findings,
-            "gaps": gaps,
-            "requirement_scores": compliance_scores
-        })
+        assessment.compliance_score = round(overall_score, 2)
+        assessment.compliance_status = "compliant" if overall_score >= 0.7 else "non_compliant" if overall_score < 0.5 else "partially_compliant"
+        assessment.findings = findings
+        assessment.gaps = gaps
+        assessment.requirement_scores = compliance_scores
         
         return assessment
 
-    def _assess_generic_section_compliance(self, assessment: Dict, document_text: str) -> Dict:
+    def _assess_generic_section_compliance(self, assessment: SectionAssessment, ctx: Dict[str, Any]) -> SectionAssessment:
         """Generic assessment for DPDPA sections"""
         
         # Basic compliance indicators
-        compliance_keywords = [
-            'data protection', 'personal data', 'consent', 'lawful basis',
-            'data subject', 'data controller', 'processing', 'privacy policy'
-        ]
-        
-        text_lower = document_text.lower()
-        keyword_matches = sum(1 for keyword in compliance_keywords if keyword in text_lower)
+        keyword_matches = ctx["doc"].keyword_hits["generic_compliance"]
         
         # Calculate basic compliance score
         if keyword_matches >= 5:
@@ -425,57 +839,51 @@ class DPDPAComplianceEngine:
             findings = []
             gaps = ["Minimal DPDPA compliance measures identified"]
         
-        assessment.update({
-            "compliance_score": score,
-            "compliance_status": status,
-            "findings": findings,
-            "gaps": gaps
-        })
+        assessment.compliance_score = score
+        assessment.compliance_status = status
+        assessment.findings = findings
+        assessment.gaps = gaps
         
         return assessment
     
-    def _apply_compliance_matrix(self, document_text: str, privacy_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    def _apply_compliance_matrix(self, ctx: Dict[str, Any]) -> Dict[str, MatrixCategoryAssessment]:
         """Apply compliance assessment matrix"""
         
         matrix_results = {}
         
         for category, criteria in self.compliance_matrix.items():
-            category_assessment = {
-                "category": category,
-                "weight": criteria["weight"],
-                "constitutional_source": criteria["constitutional_source"],
-                "puttaswamy_principle": criteria["puttaswamy_principle"],
-                "assessment_score": 0.0,
-                "evidence": [],
-                "gaps": [],
-                "criteria_scores": {}
-            }
+            category_assessment = MatrixCategoryAssessment(
+                category=category,
+                weight=criteria["weight"],
+                constitutional_source=criteria["constitutional_source"],
+                puttaswamy_principle=criteria["puttaswamy_principle"]
+            )
             
             # Assess each criterion
             for criterion in criteria["assessment_criteria"]:
-                score = self._assess_compliance_criterion(criterion, document_text, privacy_analysis)
-                category_assessment["criteria_scores"][criterion] = score
+                score = self._assess_compliance_criterion(criterion, ctx)
+                category_assessment.criteria_scores[criterion] = score
                 
                 if score >= 0.7:
-                    category_assessment["evidence"].append(f"✅ {criterion.replace('_', ' ').title()}")
+                    category_assessment.evidence.append(f"✅ {_PRETTY_LABELS[criterion]}")
                 else:
-                    category_assessment["gaps"].append(f"❌ {criterion.replace('_', ' ').title()}")
+                    category_assessment.gaps.append(f"❌ {_PRETTY_LABELS[criterion]}")
             
             # Calculate category score
-            category_assessment["assessment_score"] = (
-                sum(category_assessment["criteria_scores"].values()) / 
-                len(category_assessment["criteria_scores"])
+            category_assessment.assessment_score = (
+                sum(category_assessment.criteria_scores.values()) / 
+                len(category_assessment.criteria_scores)
             )
             
             matrix_results[category] = category_assessment
         
         return matrix_results
     
-    def _check_constitutional_alignment(self, section_compliance: Dict, matrix_assessment: Dict, privacy_analysis: Dict) -> Dict[str, Any]:
+    def _check_constitutional_alignment(self, section_compliance: Dict, matrix_assessment: Dict, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """Check alignment with constitutional privacy framework"""
         
         # Get Article 21 compliance from privacy analysis
-        article_21_compliance = privacy_analysis.get("constitutional_compliance", {})
+        article_21_compliance = ctx["article_21_compliance"]
         
         alignment_assessment = {
             "article_21_alignment": article_21_compliance.get("article_21_compliance", "unknown"),
@@ -486,6 +894,12 @@ class DPDPAComplianceEngine:
             "constitutional_recommendations": []
         }
         
+        # Scores of the constitutionally-based sections, read by both the integration score and the issues
+        constitutional_scores = {
+            section_id: section_data.compliance_score
+            for section_id, section_data in section_compliance.items() if section_data.constitutional_basis
+        }
+        
         # Calculate alignment score
         alignment_scores = []
         
@@ -494,7 +908,7 @@ class DPDPAComplianceEngine:
             alignment_scores.append(article_21_compliance["compliance_score"])
         
         # DPDPA-Constitution integration score
-        integration_score = self._assess_dpdpa_constitutional_integration(section_compliance)
+        integration_score = self._assess_dpdpa_constitutional_integration(constitutional_scores)
         alignment_scores.append(integration_score)
         
         # Puttaswamy principles compliance
@@ -506,7 +920,7 @@ class DPDPAComplianceEngine:
         # Identify alignment issues
         if alignment_assessment["alignment_score"] < 0.7:
             alignment_assessment["alignment_issues"] = self._identify_constitutional_alignment_issues(
-                section_compliance, matrix_assessment, privacy_analysis
+                constitutional_scores, article_21_compliance
             )
         
         # Generate constitutional recommendations
@@ -527,9 +941,13 @@ class DPDPAComplianceEngine:
             "mitigation_priority": []
         }
         
+        # Running total of every section and matrix score, for the overall risk score
+        total_score = 0.0
+        
         # Assess section-level risks
         for section_id, section_data in section_compliance.items():
-            score = section_data.get("compliance_score", 0)
+            score = section_data.compliance_score
+            total_score += score
             
             if score < 0.4:
                 risks["critical_issues"].append(f"Critical non-compliance in {section_id}")
@@ -540,7 +958,8 @@ class DPDPAComplianceEngine:
         
         # Assess matrix-level risks
         for category, data in matrix_assessment.items():
-            score = data.get("assessment_score", 0)
+            score = data.assessment_score
+            total_score += score
             
             if score < 0.5:
                 risks["critical_issues"].append(f"Critical gap in {category}")
@@ -548,64 +967,62 @@ class DPDPAComplianceEngine:
                 risks["high_risk_areas"].append(f"High risk in {category}")
         
         # Calculate overall risk score
-        all_scores = []
-        for section_data in section_compliance.values():
-            all_scores.append(section_data.get("compliance_score", 0))
-        
-        for matrix_data in matrix_assessment.values():
-            all_scores.append(matrix_data.get("assessment_score", 0))
-        
-        if all_scores:
-            avg_score = sum(all_scores) / len(all_scores)
+        score_count = len(section_compliance) + len(matrix_assessment)
+        if score_count:
+            avg_score = total_score / score_count
             risks["risk_score"] = round(1.0 - avg_score, 2)  # Higher score = higher risk
         
         return risks
 
     def _generate_dpdpa_recommendations(self, section_compliance: Dict, matrix_assessment: Dict, compliance_risks: Dict) -> List[str]:
         """Generate DPDPA compliance recommendations"""
-        
-        recommendations = []
+        # Return top 8 recommendations, stopping once they're found
+        return list(islice(self._recommendation_iter(section_compliance, matrix_assessment, compliance_risks), 8))
+    
+    def _recommendation_iter(self, section_compliance: Dict, matrix_assessment: Dict, compliance_risks: Dict) -> Iterator[str]:
+        """Yield DPDPA compliance recommendations in priority order"""
         
         # Section-specific recommendations
         for section_id, section_data in section_compliance.items():
-            if section_data.get("compliance_score", 0) < 0.7:
-                section_title = section_data.get("title", section_id)
-                recommendations.append(f"Improve compliance with {section_title}")
+            if section_data.compliance_score < 0.7:
+                section_title = section_data.title or section_id
+                yield f"Improve compliance with {section_title}"
         
         # Matrix-specific recommendations
         for category, data in matrix_assessment.items():
-            if data.get("assessment_score", 0) < 0.7:
-                recommendations.append(f"Strengthen {category.replace('_', ' ')}")
+            if data.assessment_score < 0.7:
+                yield f"Strengthen {category.replace('_', ' ')}"
         
         # Risk-based recommendations
         if compliance_risks.get("critical_issues"):
-            recommendations.append("Address critical compliance gaps immediately")
+            yield "Address critical compliance gaps immediately"
         
         if compliance_risks.get("high_risk_areas"):
-            recommendations.append("Develop mitigation strategies for high-risk areas")
+            yield "Develop mitigation strategies for high-risk areas"
         
         # General recommendations
-        recommendations.extend([
+        yield from (
             "Conduct regular DPDPA compliance audits",
             "Implement privacy-by-design principles",
             "Train staff on data protection requirements",
             "Establish clear data governance policies"
-        ])
-        
-        return recommendations[:8]  # Return top 8 recommendations
+        )
     
-    def _calculate_dpdpa_compliance_score(self, section_compliance: Dict, matrix_assessment: Dict, constitutional_alignment: Dict) -> Dict[str, Any]:
+    def _calculate_dpdpa_compliance_score(self, section_compliance: Dict, matrix_assessment: Dict, constitutional_alignment: Dict, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Calculate overall DPDPA compliance score"""
         
         # Section compliance scores (40% weight)
-        section_scores = [assessment["compliance_score"] for assessment in section_compliance.values()]
-        section_average = sum(section_scores) / len(section_scores) if section_scores else 0.0
+        section_average = (
+            sum(assessment.compliance_score for assessment in section_compliance.values()) / len(section_compliance)
+            if section_compliance else 0.0
+        )
         
         # Matrix assessment scores (40% weight)
-        weighted_matrix_score = sum(
-            assessment["assessment_score"] * assessment["weight"] 
-            for assessment in matrix_assessment.values()
+        matrix_scores = np.fromiter(
+            (assessment.assessment_score for assessment in matrix_assessment.values()),
+            dtype=np.float64, count=len(matrix_assessment)
         )
+        weighted_matrix_score = float(matrix_scores @ _MATRIX_WEIGHTS)
         
         # Constitutional alignment (20% weight)
         constitutional_score = constitutional_alignment.get("alignment_score", 0.0)
@@ -616,242 +1033,103 @@ class DPDPAComplianceEngine:
             weighted_matrix_score * 0.40 +
             constitutional_score * 0.20
         )
+        percentage = overall_score * 100
         
         return {
-            "overall_score": round(overall_score * 100, 2),  # Convert to percentage
+            "overall_score": round(percentage, 2),
             "component_scores": {
                 "section_compliance": round(section_average * 100, 2),
                 "matrix_assessment": round(weighted_matrix_score * 100, 2),
                 "constitutional_alignment": round(constitutional_score * 100, 2)
             },
-            "score_interpretation": self._interpret_dpdpa_score(overall_score * 100),
-            "compliance_grade": self._assign_compliance_grade(overall_score * 100),
-            "calculation_timestamp": datetime.now().isoformat()
+            "score_interpretation": self._interpret_dpdpa_score(percentage),
+            "compliance_grade": self._assign_compliance_grade(percentage),
+            "calculation_timestamp": timestamp or datetime.now().isoformat(timespec="seconds")
         }
     
     # Helper methods for specific assessments
-    def _check_lawful_processing_basis(self, document_text: str, privacy_analysis: Dict) -> float:
+    def _check_lawful_processing_basis(self, ctx: Dict[str, Any]) -> float:
         """Check for clear lawful basis for processing"""
-        lawful_basis_keywords = ["consent", "contract", "legal obligation", "legitimate interest", "vital interest"]
-        
-        score = 0.0
-        text_lower = document_text.lower()
-        
-        for keyword in lawful_basis_keywords:
-            if keyword in text_lower:
-                score += 0.2
-        
-        return min(score, 1.0)
+        return ctx["doc"].keyword_scores["lawful_basis"]
     
-    def _check_purpose_specification(self, document_text: str, privacy_analysis: Dict) -> float:
+    def _check_purpose_specification(self, ctx: Dict[str, Any]) -> float:
         """Check for clear purpose specification"""
-        purpose_keywords = ["purpose", "objective", "reason", "use", "processing for"]
-        
-        score = 0.0
-        text_lower = document_text.lower()
-        
-        for keyword in purpose_keywords:
-            if keyword in text_lower:
-                score += 0.25
-        
-        return min(score, 1.0)
-
-    def _check_data_minimization(self, document_text: str, privacy_analysis: Dict) -> float:
+        # Purpose terms ("use", "reason") appear in almost any document, so score how often
+        # they occur rather than whether they occur
+        occurrences = sum(map(ctx["doc"].lower.count, _CHECK_KEYWORDS["purpose"]))
+        return min(float(np.tanh(occurrences * 0.1)), 1.0)
+    
+    def _check_data_minimization(self, ctx: Dict[str, Any]) -> float:
         """Check for data minimization principles"""
-        minimization_keywords = ["necessary", "minimal", "required", "essential", "limited", "specific purpose"]
-        
-        score = 0.0
-        text_lower = document_text.lower()
-        
-        for keyword in minimization_keywords:
-            if keyword in text_lower:
-                score += 0.15
-        
-        return min(score, 1.0)
+        return ctx["doc"].keyword_scores["minimization"]
 
-    def _check_accuracy_requirements(self, document_text: str) -> float:
+    def _check_accuracy_requirements(self, ctx: Dict[str, Any]) -> float:
         """Check for data accuracy requirements"""
-        accuracy_keywords = ["accurate", "correct", "up-to-date", "verify", "validation"]
-        
-        score = 0.3  # Base score
-        text_lower = document_text.lower()
-        
-        for keyword in accuracy_keywords:
-            if keyword in text_lower:
-                score += 0.15
-        
-        return min(score, 1.0)
+        return ctx["doc"].keyword_scores["accuracy"]
 
-    def _check_storage_limitation(self, document_text: str) -> float:
+    def _check_storage_limitation(self, ctx: Dict[str, Any]) -> float:
         """Check for storage limitation measures"""
-        storage_keywords = ["retention", "storage period", "delete", "expire", "archive"]
-        
-        score = 0.2  # Base score
-        text_lower = document_text.lower()
-        
-        for keyword in storage_keywords:
-            if keyword in text_lower:
-                score += 0.2
-        
-        return min(score, 1.0)
+        return ctx["doc"].keyword_scores["storage"]
 
-    def _check_integrity_confidentiality(self, document_text: str) -> float:
+    def _check_integrity_confidentiality(self, ctx: Dict[str, Any]) -> float:
         """Check for integrity and confidentiality measures"""
-        integrity_keywords = ["security", "confidentiality", "integrity", "encrypt", "secure", "protection"]
-        
-        score = 0.2  # Base score
-        text_lower = document_text.lower()
-        
-        for keyword in integrity_keywords:
-            if keyword in text_lower:
-                score += 0.15
-        
-        return min(score, 1.0)
+        return ctx["doc"].keyword_scores["integrity"]
 
-    def _check_fair_reasonable_processing(self, document_text: str, privacy_analysis: Dict) -> float:
+    def _check_fair_reasonable_processing(self, ctx: Dict[str, Any]) -> float:
         """Check for fair and reasonable processing"""
-        fairness_keywords = ["fair", "reasonable", "transparent", "lawful", "proportionate"]
-        
-        score = 0.3  # Base score
-        text_lower = document_text.lower()
-        
-        for keyword in fairness_keywords:
-            if keyword in text_lower:
-                score += 0.15
-        
-        return min(score, 1.0)
+        return ctx["doc"].keyword_scores["fairness"]
 
-    def _check_technical_safeguards(self, document_text: str, privacy_analysis: Dict) -> float:
+    def _check_technical_safeguards(self, ctx: Dict[str, Any]) -> float:
         """Check for technical safeguards"""
-        technical_keywords = ["encryption", "firewall", "access control", "authentication", "technical measures"]
-        
-        score = 0.2  # Base score
-        text_lower = document_text.lower()
-        
-        for keyword in technical_keywords:
-            if keyword in text_lower:
-                score += 0.2
-        
-        return min(score, 1.0)
+        return ctx["doc"].keyword_scores["technical"]
 
-    def _check_organizational_measures(self, document_text: str) -> float:
+    def _check_organizational_measures(self, ctx: Dict[str, Any]) -> float:
         """Check for organizational measures"""
-        org_keywords = ["policy", "procedure", "training", "staff", "organizational measures"]
-        
-        score = 0.2  # Base score
-        text_lower = document_text.lower()
-        
-        for keyword in org_keywords:
-            if keyword in text_lower:
-                score += 0.2
-        
-        return min(score, 1.0)
+        return ctx["doc"].keyword_scores["organizational"]
 
-    def _check_breach_notification_procedures(self, document_text: str) -> float:
+    def _check_breach_notification_procedures(self, ctx: Dict[str, Any]) -> float:
         """Check for breach notification procedures"""
-        breach_keywords = ["breach", "notification", "incident", "report", "alert"]
-        
-        score = 0.1  # Base score
-        text_lower = document_text.lower()
-        
-        for keyword in breach_keywords:
-            if keyword in text_lower:
-                score += 0.2
-        
-        return min(score, 1.0)
+        return ctx["doc"].keyword_scores["breach"]
 
-    def _check_impact_assessment_procedures(self, document_text: str) -> float:
+    def _check_impact_assessment_procedures(self, ctx: Dict[str, Any]) -> float:
         """Check for impact assessment procedures"""
-        impact_keywords = ["impact assessment", "privacy impact", "DPIA", "assessment", "evaluation"]
-        
-        score = 0.1  # Base score
-        text_lower = document_text.lower()
-        
-        for keyword in impact_keywords:
-            if keyword in text_lower:
-                score += 0.2
-        
-        return min(score, 1.0)
+        return ctx["doc"].keyword_scores["impact"]
 
-    def _check_data_principal_right(self, document_text: str, right_type: str) -> float:
+    def _check_data_principal_right(self, ctx: Dict[str, Any], right_type: str) -> float:
         """Check for specific data principal rights"""
-        rights_keywords = {
-            "right_to_information": ["information", "notice", "inform", "disclosure"],
-            "right_to_correction": ["correct", "rectify", "update", "modify"],
-            "right_to_erasure": ["delete", "erase", "remove", "forget"],
-            "right_to_grievance_redressal": ["complaint", "grievance", "redressal", "appeal"],
-            "right_to_nominate": ["nominate", "nomination", "representative", "delegate"]
-        }
-        
-        keywords = rights_keywords.get(right_type, [])
-        score = 0.2  # Base score
-        text_lower = document_text.lower()
-        
-        for keyword in keywords:
-            if keyword in text_lower:
-                score += 0.2
-        
-        return min(score, 1.0)
+        return ctx["doc"].keyword_scores.get(right_type, 0.2)  # Base score for unlisted rights
     
-    def _assess_compliance_criterion(self, criterion: str, document_text: str, privacy_analysis: Dict) -> float:
+    def _assess_compliance_criterion(self, criterion: str, ctx: Dict[str, Any]) -> float:
         """Assess individual compliance criterion"""
-        criterion_keywords = {
-            "explicit_consent": ["explicit consent", "clear consent", "unambiguous consent"],
-            "informed_consent": ["informed consent", "information provided", "notice given"],
-            "specific_consent": ["specific consent", "purpose-specific", "granular consent"],
-            "withdrawable_consent": ["withdraw consent", "revoke consent", "opt-out"],
-            "granular_consent": ["granular consent", "specific purpose", "choice"],
-            "purpose_limitation": ["purpose limitation", "specific purpose", "intended use"],
-            "collection_limitation": ["collection limitation", "minimal collection", "necessary data"],
-            "technical_measures": ["encryption", "security", "technical safeguards"],
-            "organizational_measures": ["policies", "procedures", "training"],
-            "access_rights": ["access", "right to access", "data subject access"],
-            "correction_rights": ["correction", "rectification", "update"],
-            "erasure_rights": ["deletion", "erasure", "right to be forgotten"],
-            "privacy_notice": ["privacy notice", "privacy policy", "information notice"],
-            "processing_disclosure": ["processing disclosure", "data use", "purpose disclosure"]
-        }
-        
-        keywords = criterion_keywords.get(criterion, [criterion.replace("_", " ")])
-        text_lower = document_text.lower()
-        
-        score = 0.0
-        for keyword in keywords:
-            if keyword in text_lower:
-                score += (1.0 / len(keywords))
-        
-        return min(score, 1.0)
+        if criterion not in ctx["doc"].keyword_scores:
+            return 1.0 if criterion.replace("_", " ") in ctx["doc"].lower else 0.0
+        return ctx["doc"].keyword_scores[criterion]
 
     def _assess_puttaswamy_compliance(self, matrix_assessment: Dict) -> float:
         """Assess compliance with Puttaswamy principles"""
-        principle_scores = []
-        
-        for category, data in matrix_assessment.items():
-            principle_scores.append(data.get("assessment_score", 0))
-        
-        return sum(principle_scores) / len(principle_scores) if principle_scores else 0.0
+        principle_scores = np.fromiter(
+            (data.assessment_score for data in matrix_assessment.values()),
+            dtype=np.float64, count=len(matrix_assessment)
+        )
+        return float(principle_scores.mean()) if principle_scores.size else 0.0
 
-    def _assess_dpdpa_constitutional_integration(self, section_compliance: Dict) -> float:
+    def _assess_dpdpa_constitutional_integration(self, constitutional_scores: Dict[str, float]) -> float:
         """Assess DPDPA-Constitution integration"""
-        constitutional_sections = []
-        
-        for section_id, section_data in section_compliance.items():
-            if section_data.get("constitutional_basis"):
-                constitutional_sections.append(section_data.get("compliance_score", 0))
-        
-        return sum(constitutional_sections) / len(constitutional_sections) if constitutional_sections else 0.5
+        constitutional_sections = np.fromiter(
+            constitutional_scores.values(), dtype=np.float64, count=len(constitutional_scores)
+        )
+        return float(constitutional_sections.mean()) if constitutional_sections.size else 0.5
 
-    def _identify_constitutional_alignment_issues(self, section_compliance: Dict, matrix_assessment: Dict, privacy_analysis: Dict) -> List[str]:
+    def _identify_constitutional_alignment_issues(self, constitutional_scores: Dict[str, float], privacy_compliance: Dict) -> List[str]:
         """Identify constitutional alignment issues"""
         issues = []
         
         # Check for low scoring constitutional sections
-        for section_id, section_data in section_compliance.items():
-            if section_data.get("constitutional_basis") and section_data.get("compliance_score", 0) < 0.6:
+        for section_id, score in constitutional_scores.items():
+            if score < 0.6:
                 issues.append(f"Low compliance in constitutionally-based {section_id}")
         
         # Check privacy analysis issues
-        privacy_compliance = privacy_analysis.get("constitutional_compliance", {})
         if privacy_compliance.get("article_21_compliance") in ["non_compliant", "partially_compliant"]:
             issues.append("Article 21 privacy rights not adequately addressed")
         
@@ -879,46 +1157,19 @@ class DPDPAComplianceEngine:
 
     def _determine_compliance_status(self, overall_score: float) -> str:
         """Determine compliance status from score"""
-        if overall_score >= 80:
-            return "fully_compliant"
-        elif overall_score >= 60:
-            return "substantially_compliant"
-        elif overall_score >= 40:
-            return "partially_compliant"
-        else:
-            return "non_compliant"
+        return _STATUS_BANDS[bisect.bisect_right(_STATUS_THRESHOLDS, overall_score)]
 
     def _interpret_dpdpa_score(self, score: float) -> str:
         """Interpret DPDPA compliance score"""
-        if score >= 80:
-            return "Excellent DPDPA compliance with strong constitutional alignment"
-        elif score >= 60:
-            return "Good compliance with some areas for improvement"
-        elif score >= 40:
-            return "Moderate compliance requiring significant improvements"
-        else:
-            return "Poor compliance with major gaps requiring immediate attention"
+        return _SCORE_INTERPRETATIONS[bisect.bisect_right(_STATUS_THRESHOLDS, score)]
 
     def _assign_compliance_grade(self, score: float) -> str:
         """Assign compliance grade"""
-        if score >= 90:
-            return "A+"
-        elif score >= 80:
-            return "A"
-        elif score >= 70:
-            return "B"
-        elif score >= 60:
-            return "C"
-        elif score >= 50:
-            return "D"
-        else:
-            return "F"
+        return _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, score)]
 
-    def _generate_compliance_error_response(self, error_message: str) -> Dict[str, Any]:
+    def _generate_compliance_error_response(self, error_message: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Generate error response for failed compliance assessment"""
-        return {
-            "error": True,
-            "error_message": error_message,
-            "dpdpa_compliance_summary": {"overall_score": 0, "error": True},
-            "assessment_timestamp": datetime.now().isoformat()
-        }
+        return DPDPAErrorResult(
+            error_message=error_message,
+            assessment_timestamp=timestamp or datetime.now().isoformat(timespec="seconds")
+        ).to_dict()
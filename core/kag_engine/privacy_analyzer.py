@@ -133,11 +133,15 @@ class Article21PrivacyAnalyzer:
             }
         ]
 
-    def analyze_privacy_implications(self, document_text: str) -> Dict[str, Any]:
+    def analyze_privacy_implications(self, document_text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Comprehensive privacy analysis under Article 21 framework"""
         logger.info("🔒 Starting Article 21 privacy analysis...")
 
         try:
+            # Lowercased text shared by the principle checks (callers that already have it pass it in)
+            if text_lower is None:
+                text_lower = document_text.lower()
+
             # Step 1: Extract privacy-related clauses
             privacy_clauses = self._extract_privacy_clauses(document_text)
 
@@ -145,7 +149,7 @@ class Article21PrivacyAnalyzer:
             privacy_categorization = self._categorize_privacy_implications(privacy_clauses, document_text)
 
             # Step 3: Apply Puttaswamy principles
-            puttaswamy_analysis = self._apply_puttaswamy_principles(privacy_clauses, document_text)
+            puttaswamy_analysis = self._apply_puttaswamy_principles(privacy_clauses, text_lower)
 
             # Step 4: Analyze constitutional compliance
             constitutional_compliance = self._analyze_constitutional_privacy_compliance(
@@ -188,6 +192,7 @@ class Article21PrivacyAnalyzer:
             sentence = sentence.strip()
             if len(sentence) < 10:  # Skip very short sentences
                 continue
+            sentence_lower = sentence.lower()
 
             clause_analysis = {
                 "sentence_id": i,
@@ -202,7 +207,7 @@ class Article21PrivacyAnalyzer:
             for category, keywords in self.privacy_keywords.items():
                 found_keywords = []
                 for keyword in keywords:
-                    if keyword.lower() in sentence.lower():
+                    if keyword.lower() in sentence_lower:
                         found_keywords.append(keyword)
                         clause_analysis["intensity_score"] += 0.1
 
@@ -212,7 +217,7 @@ class Article21PrivacyAnalyzer:
 
             # Determine clause type
             if clause_analysis["privacy_keywords"]:
-                clause_analysis["clause_type"] = self._determine_clause_type(sentence, clause_analysis["privacy_keywords"])
+                clause_analysis["clause_type"] = self._determine_clause_type(sentence_lower, clause_analysis["privacy_keywords"])
 
             # Only include clauses with privacy relevance
             if clause_analysis["intensity_score"] > 0:
@@ -222,10 +227,8 @@ class Article21PrivacyAnalyzer:
         privacy_clauses.sort(key=lambda x: x["intensity_score"], reverse=True)
         return privacy_clauses[:20]  # Return top 20 most relevant clauses
 
-    def _determine_clause_type(self, sentence: str, keywords: List[str]) -> str:
-        """Determine the type of privacy clause"""
-        sentence_lower = sentence.lower()
-        
+    def _determine_clause_type(self, sentence_lower: str, keywords: List[str]) -> str:
+        """Determine the type of privacy clause from the lowercased sentence"""
         if any(kw in sentence_lower for kw in ["consent", "authorization", "permission"]):
             return "consent_clause"
         elif any(kw in sentence_lower for kw in ["collect", "process", "store"]):
@@ -306,7 +309,7 @@ class Article21PrivacyAnalyzer:
         }
         return keyword_category in relevance_mapping.get(privacy_category, [])
 
-    def _apply_puttaswamy_principles(self, privacy_clauses: List[Dict], document_text: str) -> Dict[str, Any]:
+    def _apply_puttaswamy_principles(self, privacy_clauses: List[Dict], text_lower: str) -> Dict[str, Any]:
         """Apply Puttaswamy judgment principles to document analysis"""
         principle_analysis = {}
 
@@ -324,19 +327,19 @@ class Article21PrivacyAnalyzer:
 
             # Analyze compliance for each principle
             if principle_name == "Privacy as Fundamental Right":
-                analysis = self._analyze_fundamental_right_compliance(analysis, privacy_clauses, document_text)
+                analysis = self._analyze_fundamental_right_compliance(analysis, privacy_clauses, text_lower)
             elif principle_name == "Informational Self-Determination":
-                analysis = self._analyze_self_determination_compliance(analysis, privacy_clauses, document_text)
+                analysis = self._analyze_self_determination_compliance(analysis, privacy_clauses, text_lower)
             elif principle_name == "Data Minimization":
-                analysis = self._analyze_minimization_compliance(analysis, privacy_clauses, document_text)
+                analysis = self._analyze_minimization_compliance(analysis, privacy_clauses, text_lower)
             elif principle_name == "Transparency and Accountability":
-                analysis = self._analyze_transparency_compliance(analysis, privacy_clauses, document_text)
+                analysis = self._analyze_transparency_compliance(analysis, privacy_clauses, text_lower)
 
             principle_analysis[principle_name] = analysis
 
         return principle_analysis
 
-    def _analyze_fundamental_right_compliance(self, analysis: Dict, privacy_clauses: List[Dict], document_text: str) -> Dict:
+    def _analyze_fundamental_right_compliance(self, analysis: Dict, privacy_clauses: List[Dict], text_lower: str) -> Dict:
         """Analyze compliance with privacy as fundamental right"""
         score = 0.5  # Base score
         evidence = []
@@ -344,7 +347,7 @@ class Article21PrivacyAnalyzer:
         recommendations = []
 
         # Check for constitutional references
-        if "article 21" in document_text.lower() or "fundamental right" in document_text.lower():
+        if "article 21" in text_lower or "fundamental right" in text_lower:
             score += 0.3
             evidence.append("Document references constitutional privacy rights")
         else:
@@ -353,7 +356,7 @@ class Article21PrivacyAnalyzer:
 
         # Check for privacy protection measures
         protection_terms = ["protect", "safeguard", "secure", "privacy policy", "data protection"]
-        protection_count = sum(1 for term in protection_terms if term in document_text.lower())
+        protection_count = sum(1 for term in protection_terms if term in text_lower)
         
         if protection_count >= 3:
             score += 0.2
@@ -374,7 +377,7 @@ class Article21PrivacyAnalyzer:
 
         return analysis
 
-    def _analyze_self_determination_compliance(self, analysis: Dict, privacy_clauses: List[Dict], document_text: str) -> Dict:
+    def _analyze_self_determination_compliance(self, analysis: Dict, privacy_clauses: List[Dict], text_lower: str) -> Dict:
         """Analyze compliance with informational self-determination"""
         score = 0.4  # Base score
         evidence = []
@@ -383,7 +386,7 @@ class Article21PrivacyAnalyzer:
 
         # Check for consent mechanisms
         consent_terms = ["consent", "choice", "control", "opt-in", "opt-out"]
-        consent_mentions = sum(1 for term in consent_terms if term in document_text.lower())
+        consent_mentions = sum(1 for term in consent_terms if term in text_lower)
         
         if consent_mentions >= 3:
             score += 0.4
@@ -397,7 +400,7 @@ class Article21PrivacyAnalyzer:
 
         # Check for user control features
         control_terms = ["withdraw", "modify", "update", "delete", "access"]
-        control_count = sum(1 for term in control_terms if term in document_text.lower())
+        control_count = sum(1 for term in control_terms if term in text_lower)
         
         if control_count >= 2:
             score += 0.2
@@ -416,7 +419,7 @@ class Article21PrivacyAnalyzer:
 
         return analysis
 
-    def _analyze_minimization_compliance(self, analysis: Dict, privacy_clauses: List[Dict], document_text: str) -> Dict:
+    def _analyze_minimization_compliance(self, analysis: Dict, privacy_clauses: List[Dict], text_lower: str) -> Dict:
         """Analyze compliance with data minimization principle"""
         score = 0.3  # Base score
         evidence = []
@@ -425,7 +428,7 @@ class Article21PrivacyAnalyzer:
 
         # Check for minimization language
         minimization_terms = ["necessary", "required", "essential", "minimum", "limited", "specific purpose"]
-        minimization_count = sum(1 for term in minimization_terms if term in document_text.lower())
+        minimization_count = sum(1 for term in minimization_terms if term in text_lower)
         
         if minimization_count >= 3:
             score += 0.4
@@ -438,7 +441,7 @@ class Article21PrivacyAnalyzer:
 
         # Check for retention limitations
         retention_terms = ["retention", "storage period", "delete after", "expire"]
-        if any(term in document_text.lower() for term in retention_terms):
+        if any(term in text_lower for term in retention_terms):
             score += 0.3
             evidence.append("Data retention limitations mentioned")
         else:
@@ -455,7 +458,7 @@ class Article21PrivacyAnalyzer:
 
         return analysis
 
-    def _analyze_transparency_compliance(self, analysis: Dict, privacy_clauses: List[Dict], document_text: str) -> Dict:
+    def _analyze_transparency_compliance(self, analysis: Dict, privacy_clauses: List[Dict], text_lower: str) -> Dict:
         """Analyze compliance with transparency and accountability"""
         score = 0.4  # Base score
         evidence = []
@@ -464,7 +467,7 @@ class Article21PrivacyAnalyzer:
 
         # Check for transparency measures
         transparency_terms = ["notice", "inform", "disclose", "transparency", "privacy policy"]
-        transparency_count = sum(1 for term in transparency_terms if term in document_text.lower())
+        transparency_count = sum(1 for term in transparency_terms if term in text_lower)
         
         if transparency_count >= 3:
             score += 0.3
@@ -477,7 +480,7 @@ class Article21PrivacyAnalyzer:
 
         # Check for accountability measures
         accountability_terms = ["responsible", "accountable", "audit", "review", "compliance"]
-        accountability_count = sum(1 for term in accountability_terms if term in document_text.lower())
+        accountability_count = sum(1 for term in accountability_terms if term in text_lower)
         
         if accountability_count >= 2:
             score += 0.3
@@ -10,13 +10,32 @@ from .constitutional_articles import CONSTITUTIONAL_ARTICLES, DPDPA_PROVISIONS,
 
 logger = logging.getLogger(__name__)
 
+# Endpoint matching shared by the pathway queries
+_PATHWAY_ENDPOINTS = """
+        MATCH (start) WHERE start.name CONTAINS {start} OR start.title CONTAINS {start}
+        MATCH (end) WHERE end.name CONTAINS {end} OR end.title CONTAINS {end}
+"""
+
 class ConstitutionalKnowledgeGraph:
     """Manages constitutional knowledge graph in Neo4j"""
     
     def __init__(self):
         self.neo4j = get_neo4j_connection()
+        self._has_apoc = None
         self.setup_constraints()
     
+    def _apoc_available(self) -> bool:
+        """Check whether APOC's path expander is installed, remembering the answer once the probe succeeds"""
+        if self._has_apoc is None:
+            rows = self.neo4j.execute_query_checked(
+                "SHOW PROCEDURES YIELD name WHERE name = 'apoc.path.expandConfig' RETURN count(*) AS n"
+            )
+            if rows is None:
+                # Probe failed (e.g. database unreachable); use the plain query and ask again next time
+                return False
+            self._has_apoc = bool(rows and rows[0]["n"])
+        return self._has_apoc
+    
     def setup_constraints(self):
         """Create database constraints and indexes with FIXED syntax"""
         constraints = [
@@ -93,8 +112,8 @@ class ConstitutionalKnowledgeGraph:
                 "chapter": article_data["chapter"],
                 "privacy_implications": article_data["privacy_implications"],
                 "dpdpa_relevance": article_data["dpdpa_relevance"],
-                "landmark_cases": article_data.get("landmark_cases", []),
-                "privacy_scope": article_data.get("privacy_scope", [])
+                "landmark_cases": list(article_data.get("landmark_cases", [])),
+                "privacy_scope": list(article_data.get("privacy_scope", []))
             }
             
             self.neo4j.execute_write_query(query, params)
@@ -254,10 +273,22 @@ class ConstitutionalKnowledgeGraph:
     
     def find_constitutional_pathway(self, start_concept: str, end_concept: str, max_hops: int = 4) -> List[Dict]:
         """Find constitutional reasoning pathway between concepts"""
-        query = """
+        endpoints = _PATHWAY_ENDPOINTS.format(start="$start_concept", end="$end_concept")
+        if self._apoc_available():
+            # Breadth-first expansion bounded by max_hops, first path per start node
+            query = endpoints + """
+        WITH start, collect(end) AS ends
+        WHERE size(ends) > 0
+        CALL apoc.path.expandConfig(start, {
+            terminatorNodes: ends, bfs: true, maxLevel: $max_hops, uniqueness: 'NODE_GLOBAL', limit: 1
+        }) YIELD path
+        RETURN path LIMIT 10
+        """
+        else:
+            # Variable-length bounds can't be parameters, so bound by path length instead
+            query = endpoints + """
         MATCH path = shortestPath((start)-[*1..6]-(end))
-        WHERE (start.name CONTAINS $start_concept OR start.title CONTAINS $start_concept)
-        AND (end.name CONTAINS $end_concept OR end.title CONTAINS $end_concept)
+        WHERE length(path) <= $max_hops
         RETURN path LIMIT 10
         """
         
@@ -286,12 +317,63 @@ class ConstitutionalKnowledgeGraph:
         """
         
         try:
-            results = self.neo4j.execute_query(query, {"article_number": article_number})
-            return results[0] if results else {}
+            return self.neo4j.execute_single(query, {"article_number": article_number})
         except Exception as e:
             logger.error(f"Article context query failed: {e}")
             return {}
     
+    def get_articles_batch(self, article_numbers: List[int]) -> List[Dict[str, Any]]:
+        """Get text for several constitutional articles in a single round-trip"""
+        query = """
+        UNWIND $nums AS n
+        MATCH (a:Article {number: n})
+        RETURN n AS num, a.text AS text
+        """
+        
+        try:
+            return self.neo4j.execute_query(query, {"nums": article_numbers})
+        except Exception as e:
+            logger.error(f"Batch article query failed: {e}")
+            return []
+    
+    def find_pathways_batch(self, start_concepts: List[str], targets: List[Tuple[str, int]]) -> Optional[Dict[Tuple[str, str], List[Dict]]]:
+        """Find pathways from every start concept to every (end concept, max hops) target in one round-trip.
+        
+        Returns None if the query failed, so an empty result reliably means no pathways exist.
+        """
+        endpoints = """
+        UNWIND $sources AS s
+        UNWIND $targets AS t""" + _PATHWAY_ENDPOINTS.format(start="s", end="t.concept")
+        if self._apoc_available():
+            query = endpoints + """
+        WITH s, t, start, collect(end) AS ends
+        WHERE size(ends) > 0
+        CALL apoc.path.expandConfig(start, {
+            terminatorNodes: ends, bfs: true, maxLevel: t.max_hops, uniqueness: 'NODE_GLOBAL', limit: 1
+        }) YIELD path
+        WITH s, t, collect(path)[..10] AS paths
+        RETURN s AS source, t.concept AS target, paths
+        """
+        else:
+            query = endpoints + """
+        MATCH path = shortestPath((start)-[*1..6]-(end))
+        WHERE length(path) <= t.max_hops
+        WITH s, t, collect(path)[..10] AS paths
+        RETURN s AS source, t.concept AS target, paths
+        """
+        
+        try:
+            results = self.neo4j.execute_query_checked(query, {
+                "sources": start_concepts,
+                "targets": [{"concept": concept, "max_hops": hops} for concept, hops in targets]
+            })
+            if results is None:
+                return None
+            return {(row["source"], row["target"]): [{"path": path} for path in row["paths"]] for row in results}
+        except Exception as e:
+            logger.error(f"Batch pathway search failed: {e}")
+            return None
+    
     def analyze_privacy_implications(self, document_concepts: List[str]) -> Dict[str, Any]:
         """Analyze privacy implications of document concepts using knowledge graph"""
         implications = {
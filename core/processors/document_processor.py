@@ -529,6 +529,8 @@ import fitz  # PyMuPDF
 import re
 import os
 from io import BytesIO
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Dict, Any, Optional, Tuple
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from sentence_transformers import SentenceTransformer
@@ -552,6 +554,32 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ProcessingResult:
+    """Typed view of a successful process_document_complete() result for UI consumers"""
+    enhanced_chunks: list = field(default_factory=list)
+    metadata: dict = field(default_factory=dict)
+    document_classification: dict = field(default_factory=dict)
+    processing_stats: dict = field(default_factory=dict)
+    raw: dict = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, result: Dict[str, Any]) -> "ProcessingResult":
+        """Wrap a processing result dict, keeping the original for dict-based consumers"""
+        return cls(
+            enhanced_chunks=result.get("enhanced_chunks", []),
+            metadata=result.get("metadata", {}),
+            document_classification=result.get("document_classification", {}),
+            processing_stats=result.get("processing_stats", {}),
+            raw=result
+        )
+    
+    @cached_property
+    def full_text(self) -> str:
+        """Document text joined from the chunks (computed on first access)"""
+        return "\n".join(chunk.get("text", "") for chunk in self.enhanced_chunks)
+
+
 class IndianLegalDocumentProcessor:
     """Enhanced document processor specifically for Indian legal documents with OCR fallback"""
     
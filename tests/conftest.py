@@ -0,0 +1,36 @@
+"""
+Shared test setup: repository root on sys.path and stand-ins for the graph-backed modules
+"""
+import importlib
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+class _UnavailableBackend:
+    """Stand-in for components that need Neo4j; engines treat the failure as 'not available'"""
+    def __init__(self, *args, **kwargs):
+        raise RuntimeError("Neo4j-backed components are not available in tests")
+
+def _stub_module(name: str, **attributes):
+    """Register a placeholder module (and its parent packages) unless a real one is already loaded"""
+    parts = name.split(".")
+    for depth in range(1, len(parts)):
+        package = ".".join(parts[:depth])
+        try:
+            importlib.import_module(package)
+        except ModuleNotFoundError:
+            module = types.ModuleType(package)
+            module.__path__ = []
+            sys.modules[package] = module
+    if name not in sys.modules:
+        module = types.ModuleType(name)
+        module.__dict__.update(attributes)
+        sys.modules[name] = module
+
+# Modules the KAG engines import relative to core.kag_engine
+_stub_module("core.kag_engine.knowledge_graph.neo4j_manager", ConstitutionalKnowledgeGraph=_UnavailableBackend)
+_stub_module("core.kag_engine.kag_engine.privacy_analyzer", Article21PrivacyAnalyzer=_UnavailableBackend)
@@ -0,0 +1,74 @@
+"""
+DPDPA compliance scoring regression tests
+"""
+import numpy as np
+import pytest
+from core.kag_engine import dpdpa_compliance
+from core.kag_engine.dpdpa_compliance import (
+    DPDPAComplianceEngine, _PreparedDoc, _KEYWORD_GROUPS, _CATEGORY_RULES, _SCAN_CATEGORIES, _SCAN_KEYWORDS
+)
+
+# Document whose section 5 score moved from 0.23 to 0.22 when scores were computed as base + step * hits
+BOUNDARY_DOCUMENT = (
+    "category Transparency and Accountability Calculate overall DPDPA compliance score privacy notice "
+    "Right to information breach response procedures notification complaint protection data breach "
+    "response procedures Security and Integrity Identify constitutional alignment issues specific consent "
+    "revoke consent"
+)
+
+DOCUMENTS = [
+    "",
+    "We collect personal data with consent for a specific purpose.",
+    "Data is accurate, complete and up to date; we correct and verify records.",
+    "Breach notification: report any incident and alert the board after an impact assessment.",
+    "Encryption, access control and security policies are reviewed in training and audit procedures.",
+    BOUNDARY_DOCUMENT
+]
+
+def _baseline_score(text_lower, keywords, base, step):
+    """Per-keyword accumulation the DPDPA checks used before scoring was vectorized"""
+    score = base
+    for keyword in keywords:
+        if keyword in text_lower:
+            score += step
+    return min(score, 1.0)
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_keyword_scores_match_per_keyword_accumulation(document):
+    """Category scores are bit-identical to repeated addition (e.g. 0.7, not 0.7000000000000001)"""
+    doc = _PreparedDoc.from_text(document)
+    text_lower = document.lower()
+    for category, (base, step) in zip(_SCAN_CATEGORIES, _CATEGORY_RULES):
+        expected = _baseline_score(text_lower, _KEYWORD_GROUPS[category], base, step)
+        assert doc.keyword_scores[category] == expected, category
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_regex_fallback_matches_substring_search(document, monkeypatch):
+    """Without pyahocorasick, the regex scan flags exactly the keywords contained in the text"""
+    monkeypatch.setattr(dpdpa_compliance, "_KEYWORD_AUTOMATON", None)
+    text_lower = document.lower()
+    expected = np.array([keyword in text_lower for keyword in _SCAN_KEYWORDS])
+    assert np.array_equal(dpdpa_compliance._scan_keywords(text_lower), expected)
+
+def test_assessment_scores_match_baseline():
+    """Rounded section and overall scores match the values produced by the per-keyword checks"""
+    engine = DPDPAComplianceEngine()
+    result = engine.assess_dpdpa_compliance(BOUNDARY_DOCUMENT, {"constitutional_compliance": {}})
+
+    assert result["section_compliance"]["section_5"]["compliance_score"] == 0.23
+    assert result["section_compliance"]["section_8"]["requirement_scores"] == {
+        "fair_reasonable_processing": 0.3,
+        "technical_safeguards": 0.2,
+        "organizational_measures": 0.4,
+        "breach_notification": 0.5,
+        "impact_assessment": 0.1
+    }
+    assert result["overall_score"]["overall_score"] == 19.95
+    assert result["overall_score"]["component_scores"] == {
+        "section_compliance": 33.8,
+        "matrix_assessment": 7.0,
+        "constitutional_alignment": 18.17
+    }
+
+if __name__ == "__main__":
+    pytest.main([__file__])